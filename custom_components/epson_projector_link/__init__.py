@@ -1,17 +1,41 @@
 """The epson integration."""
 
 import asyncio
+from contextlib import asynccontextmanager
 import logging
 
+from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_PLATFORM
 from homeassistant.components.media_player import DOMAIN as MEDIA_PLAYER_PLATFORM
+from homeassistant.components.select import DOMAIN as SELECT_PLATFORM
+from homeassistant.components.sensor import DOMAIN as SENSOR_PLATFORM
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry as dr
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from .const import DOMAIN
+from .const import POLL_CYCLES
+from .const import POLL_POWER
+from .const import POLL_PROPERTIES
+from .const import PROPERTY_BACKOFFS
+from .const import SIGNAL_OPTIONS_UPDATED
+from .poll import PollCycle
+from .poll import PropertyBackoff
 from .projector import Projector
+from .services import async_setup_services
+from .websocket_api import async_setup_websocket_api
 
-PLATFORMS = [MEDIA_PLAYER_PLATFORM]
+PLATFORMS = [
+    BINARY_SENSOR_PLATFORM,
+    MEDIA_PLAYER_PLATFORM,
+    SELECT_PLATFORM,
+    SENSOR_PLATFORM,
+]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,19 +46,75 @@ def create_projector(data):
     )
 
 
+@asynccontextmanager
+async def async_use_projector(hass, data, entry_id=None):
+    """
+    Use the projector of a loaded config entry, or a temporary one otherwise.
+
+    Projectors typically allow a single control session, so a loaded entry's
+    projector is shared rather than opening a second connection. A temporary
+    projector is always closed afterwards.
+    """
+    projector = hass.data.get(DOMAIN, {}).get(entry_id)
+    if projector is not None:
+        yield projector
+        return
+
+    projector = create_projector(data)
+    try:
+        yield projector
+    finally:
+        await projector.async_stop()
+
+
+async def async_setup(hass: HomeAssistant, config) -> bool:
+    """Set up the epson integration."""
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up epson from a config entry."""
     projector = create_projector(config_entry.data)
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][config_entry.entry_id] = projector
+    hass.data.setdefault(POLL_CYCLES, {})[config_entry.entry_id] = {
+        poll: PollCycle(hass, poll) for poll in (POLL_POWER, POLL_PROPERTIES)
+    }
+    hass.data.setdefault(PROPERTY_BACKOFFS, {})[
+        config_entry.entry_id
+    ] = PropertyBackoff()
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
     config_entry.async_on_unload(config_entry.add_update_listener(update_listener))
+    config_entry.async_on_unload(
+        projector.add_event_callback(
+            lambda event, data: _async_fire_event(hass, config_entry, event, data)
+        )
+    )
 
     return True
 
 
+@callback
+def _async_fire_event(hass, config_entry, event, data):
+    """Fire a projector warning or alarm transition on the event bus."""
+    device = dr.async_get(hass).async_get_device(
+        identifiers={(DOMAIN, config_entry.unique_id)}
+    )
+    hass.bus.async_fire(
+        f"{DOMAIN}_{event}",
+        {
+            "entry_id": config_entry.entry_id,
+            "device_id": None if device is None else device.id,
+            "name": config_entry.title,
+            **data,
+        },
+    )
+
+
 async def update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Update options."""
     if config_entry.data == config_entry.options:
@@ -43,14 +123,23 @@ async def update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> Non
         )
         return
 
-    _LOGGER.debug(
-        "update_listener: Updating options and reloading %s", config_entry.entry_id
+    host_changed = config_entry.options.get(CONF_HOST) != config_entry.data.get(
+        CONF_HOST
     )
     hass.config_entries.async_update_entry(
         entry=config_entry,
         data=config_entry.options.copy(),
     )
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    if host_changed:
+        _LOGGER.debug(
+            "update_listener: Host changed, reloading %s", config_entry.entry_id
+        )
+        await hass.config_entries.async_reload(config_entry.entry_id)
+        return
+
+    # Other options are applied in place, keeping the connection and its state
+    _LOGGER.debug("update_listener: Applying options to %s", config_entry.entry_id)
+    async_dispatcher_send(hass, SIGNAL_OPTIONS_UPDATED.format(config_entry.entry_id))
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
@@ -64,5 +153,9 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         )
     )
     if unloaded:
-        hass.data[DOMAIN].pop(config_entry.entry_id)
+        projector = hass.data[DOMAIN].pop(config_entry.entry_id)
+        for poll_cycle in hass.data[POLL_CYCLES].pop(config_entry.entry_id).values():
+            poll_cycle.cancel()
+        hass.data[PROPERTY_BACKOFFS].pop(config_entry.entry_id)
+        await projector.async_stop()
     return unloaded
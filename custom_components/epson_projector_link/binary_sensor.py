@@ -0,0 +1,56 @@
+"""Binary sensors for Epson projector properties."""
+
+import logging
+
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.components.binary_sensor import BinarySensorEntityDescription
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_OFF
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.restore_state import RestoreEntity
+
+from .const import PROPERTY_TO_ATTRIBUTE_NAME_MAP
+from .entity import EpsonProjectorPropertyEntity
+from .entity import async_setup_property_entities
+from .projector.const import PROPERTY_MUTE
+
+_LOGGER = logging.getLogger(__name__)
+
+BINARY_SENSOR_DESCRIPTIONS = {
+    PROPERTY_MUTE: BinarySensorEntityDescription(
+        key=PROPERTY_TO_ATTRIBUTE_NAME_MAP[PROPERTY_MUTE],
+    ),
+}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities
+):
+    """Set up the Epson projector binary sensors from a config entry."""
+    async_setup_property_entities(
+        hass,
+        config_entry,
+        async_add_entities,
+        EpsonProjectorBinarySensor,
+        BINARY_SENSOR_DESCRIPTIONS,
+    )
+
+
+class EpsonProjectorBinarySensor(
+    EpsonProjectorPropertyEntity, BinarySensorEntity, RestoreEntity
+):
+    """Binary sensor of a polled Epson projector property."""
+
+    def __init__(self, config_entry, projector, prop):
+        super().__init__(config_entry, projector, prop)
+        self.entity_description = BINARY_SENSOR_DESCRIPTIONS[prop]
+
+    async def _async_restore_value(self):
+        last_state = await self.async_get_last_state()
+        if last_state is None or last_state.state not in (STATE_OFF, STATE_ON):
+            return
+        self._restore_value(last_state.state == STATE_ON)
+
+    def _update_value(self, value):
+        self._attr_is_on = value
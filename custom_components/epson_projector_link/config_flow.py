@@ -1,9 +1,11 @@
 """Adds config flow for Epson Projector Link."""
 
 import asyncio
+import ipaddress
 import logging
 
 from homeassistant import config_entries
+from homeassistant.components import network
 from homeassistant.const import CONF_HOST
 from homeassistant.const import CONF_NAME
 from homeassistant.const import CONF_SCAN_INTERVAL
@@ -12,15 +14,19 @@ from homeassistant.core import callback
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 
-from . import create_projector
+from . import async_use_projector
+from .const import CONF_NETWORK
+from .const import CONF_OPTIMISTIC
 from .const import CONF_POLL_PROPERTIES
 from .const import CONF_PROPERTIES_SCAN_INTERVAL
 from .const import DEFAULT_POWER_SCAN_INTERVAL
 from .const import DEFAULT_PROPERTIES_SCAN_INTERVAL
+from .const import DISCOVERY_MAX_HOSTS
 from .const import DOMAIN
 from .const import PROPERTY_TO_ATTRIBUTE_NAME_MAP
 from .projector.const import PROPERTY_POWER
 from .projector.const import PROPERTY_SERIAL_NUMBER
+from .projector.discovery import async_discover
 from .projector.exceptions import ProjectorErrorResponse
 
 _LOGGER = logging.getLogger(__name__)
@@ -63,6 +69,9 @@ def _create_options_schema(user_input, is_config):
             vol.Optional(
                 CONF_POLL_PROPERTIES, default=user_input.get(CONF_POLL_PROPERTIES, [])
             ): cv.multi_select(PROPERTY_SELECT_OPTIONS),
+            vol.Optional(
+                CONF_OPTIMISTIC, default=user_input.get(CONF_OPTIMISTIC, False)
+            ): bool,
         }
     )
     return vol.Schema(schema)
@@ -110,34 +119,107 @@ class EpsonProjectorLinkFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_PUSH
 
+    def __init__(self):
+        """Initialize."""
+        self._discovered = {}
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["discover", "manual"])
+
+    async def async_step_discover(self, user_input=None):
+        """Scan a network for projectors."""
         errors = {}
         if user_input is not None:
-            projector = create_projector(user_input)
+            try:
+                scan_network = ipaddress.ip_network(
+                    user_input[CONF_NETWORK], strict=False
+                )
+            except ValueError:
+                errors["base"] = "invalid_network"
+            else:
+                if scan_network.num_addresses > DISCOVERY_MAX_HOSTS:
+                    errors["base"] = "network_too_large"
 
-            # Abort if existing project with same serial number
-            serial_no = await _async_get_property(
-                projector, PROPERTY_SERIAL_NUMBER, errors
-            )
             if len(errors) == 0:
-                await self.async_set_unique_id(serial_no)
-                self._abort_if_unique_id_configured()
+                # Don't probe configured projectors, that would open a second session
+                entries = self._async_current_entries(include_ignore=False)
+                projectors = await async_discover(
+                    str(scan_network),
+                    exclude_hosts={entry.data.get(CONF_HOST) for entry in entries},
+                    exclude_serial_numbers={entry.unique_id for entry in entries},
+                )
+                self._discovered = {
+                    projector.host: f"{projector.host} ({projector.serial_number})"
+                    for projector in projectors
+                }
+                if len(self._discovered) > 0:
+                    return await self.async_step_pick()
+                errors["base"] = "no_projectors_found"
+
+        if user_input is None:
+            user_input = {CONF_NETWORK: await self._async_get_default_network()}
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_NETWORK, default=user_input.get(CONF_NETWORK, "")
+                    ): str
+                }
+            ),
+            errors=errors,
+        )
+
+    async def _async_get_default_network(self):
+        try:
+            source_ip = await network.async_get_source_ip(self.hass)
+        except Exception as err:
+            _LOGGER.debug("_async_get_default_network: No source IP: %s", err)
+            return ""
+        return str(ipaddress.ip_network(f"{source_ip}/24", strict=False))
+
+    async def async_step_pick(self, user_input=None):
+        """Pick a discovered projector."""
+        if user_input is not None:
+            return await self.async_step_manual(
+                None, defaults={CONF_HOST: user_input[CONF_HOST]}
+            )
 
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema({vol.Required(CONF_HOST): vol.In(self._discovered)}),
+        )
+
+    async def async_step_manual(self, user_input=None, defaults=None):
+        """Enter the projector host and options."""
+        errors = {}
+        if user_input is not None:
+            # Abort before connecting, since a configured projector already has
+            # a session open and may accept only one
+            self._async_abort_entries_match({CONF_HOST: user_input[CONF_HOST]})
+            async with async_use_projector(self.hass, user_input) as projector:
+                # Abort if existing project with same serial number
+                serial_no = await _async_get_property(
+                    projector, PROPERTY_SERIAL_NUMBER, errors
+                )
                 if len(errors) == 0:
+                    await self.async_set_unique_id(serial_no)
+                    self._abort_if_unique_id_configured()
+
                     # Validate additional properties
                     await _async_validate_additional_properties(
                         projector, user_input.get(CONF_POLL_PROPERTIES), errors
                     )
 
-                    if len(errors) == 0:
-                        return self.async_create_entry(
-                            title=user_input.pop(CONF_NAME), data=user_input
-                        )
+            if len(errors) == 0:
+                return self.async_create_entry(
+                    title=user_input.pop(CONF_NAME), data=user_input
+                )
 
         return self.async_show_form(
-            step_id="user",
-            data_schema=_create_options_schema(user_input, is_config=True),
+            step_id="manual",
+            data_schema=_create_options_schema(user_input or defaults, is_config=True),
             errors=errors,
         )
 
@@ -152,6 +234,7 @@ class EpsonProjectorLinkOptionsFlowHandler(config_entries.OptionsFlow):
 
     def __init__(self, config_entry):
         """Initialize."""
+        self._entry_id = config_entry.entry_id
         self._original_data = dict(config_entry.data)
         self._data = dict(config_entry.data)
 
@@ -165,10 +248,13 @@ class EpsonProjectorLinkOptionsFlowHandler(config_entries.OptionsFlow):
             old_properties = self._original_data.get(CONF_POLL_PROPERTIES)
             new_properties = self._data.get(CONF_POLL_PROPERTIES)
             if new_properties != old_properties:
-                projector = create_projector(self._data)
-                await _async_validate_additional_properties(
-                    projector, user_input.get(CONF_POLL_PROPERTIES), errors
-                )
+                # Validate through the live connection of the loaded entry
+                async with async_use_projector(
+                    self.hass, self._data, self._entry_id
+                ) as projector:
+                    await _async_validate_additional_properties(
+                        projector, user_input.get(CONF_POLL_PROPERTIES), errors
+                    )
 
             if len(errors) == 0:
                 return self.async_create_entry(title="", data=self._data)
@@ -13,13 +13,36 @@ from .projector.const import PROPERTY_SOURCE
 from .projector.const import PROPERTY_VOLUME
 
 DOMAIN = "epson_projector_link"
+# hass.data key of the PollCycle of each poll, by config entry id
+POLL_CYCLES = f"{DOMAIN}_poll_cycles"
+POLL_POWER = "power"
+POLL_PROPERTIES = "properties"
+# hass.data key of the PropertyBackoff of the properties poll, by config entry id
+PROPERTY_BACKOFFS = f"{DOMAIN}_property_backoffs"
+# Dispatcher signal of options applied without a reload, formatted with entry id
+SIGNAL_OPTIONS_UPDATED = f"{DOMAIN}_options_updated_{{}}"
 
+CONF_NETWORK = "network"
+CONF_OPTIMISTIC = "optimistic"
 CONF_POLL_PROPERTIES = "poll_properties"
 CONF_PROPERTIES_SCAN_INTERVAL = "poll_properties_scan_interval"
 
 DEFAULT_POWER_SCAN_INTERVAL = 600
 DEFAULT_PROPERTIES_SCAN_INTERVAL = 60
 POWER_TIMEOUT_RETRY_INTERVAL = timedelta(seconds=10)
+# Seconds a polled property is skipped after failing, doubling per failure
+PROPERTY_BACKOFF_INITIAL_DELAY = 60
+PROPERTY_BACKOFF_MAX_DELAY = 3600
+# Consecutive failures before a property is unsupported, and seconds until
+# it is probed again unless the projector powers on first
+PROPERTY_UNSUPPORTED_THRESHOLD = 5
+PROPERTY_REPROBE_INTERVAL = 6 * 3600
+DEFAULT_BULK_MAX_CONCURRENCY = 8
+DEFAULT_BULK_TIMEOUT = 10
+DEFAULT_SYNCHRONIZED_TIMEOUT = 10
+
+# Largest network the config flow scans for projectors, e.g. a /22 network
+DISCOVERY_MAX_HOSTS = 1024
 
 # Update error messages in strings.json and translations/en.json
 PROPERTY_TO_ATTRIBUTE_NAME_MAP = {
@@ -36,10 +59,17 @@ PROPERTY_TO_ATTRIBUTE_NAME_MAP = {
 
 STATE_ERROR = "error"
 
+SERVICE_BULK_COMMAND = "bulk_command"
 SERVICE_LOAD_LENS_MEMORY = "load_lens_memory"
 SERVICE_LOAD_PICTURE_MEMORY = "load_picture_memory"
+SERVICE_RUN_SEQUENCE = "run_sequence"
 SERVICE_SELECT_AUTO_IRIS_MODE = "select_auto_iris_mode"
 SERVICE_SELECT_COLOR_MODE = "select_color_mode"
 SERVICE_SELECT_POWER_CONSUMPTION_MODE = "select_power_consumption_mode"
 SERVICE_SEND_COMMAND = "send_command"
 SERVICE_SET_BRIGHTNESS = "set_brightness"
+SERVICE_STOP_KEY_STREAM = "stop_key_stream"
+SERVICE_STREAM_KEY = "stream_key"
+SERVICE_SYNCHRONIZED_COMMAND = "synchronized_command"
+
+WS_TYPE_SUBSCRIBE = f"{DOMAIN}/subscribe"
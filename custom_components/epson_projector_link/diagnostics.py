@@ -0,0 +1,33 @@
+"""Diagnostics support for the epson integration."""
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .const import POLL_CYCLES
+from .const import PROPERTY_BACKOFFS
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+):
+    """Return diagnostics for a config entry."""
+    projector = hass.data[DOMAIN][config_entry.entry_id]
+    return {
+        "entry": async_redact_data(config_entry.as_dict(), TO_REDACT),
+        "state": projector.state.as_dict(),
+        "history": projector.history.as_dict(),
+        "rtt": projector.rtt.as_dict(),
+        "breaker": projector.breaker.as_dict(),
+        "polls": {
+            poll: poll_cycle.as_dict()
+            for poll, poll_cycle in hass.data[POLL_CYCLES][
+                config_entry.entry_id
+            ].items()
+        },
+        "properties": hass.data[PROPERTY_BACKOFFS][config_entry.entry_id].as_dict(),
+    }
@@ -0,0 +1,151 @@
+"""Base entities for the epson integration."""
+
+from abc import abstractmethod
+import logging
+
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
+
+from .const import CONF_OPTIMISTIC
+from .const import CONF_POLL_PROPERTIES
+from .const import DOMAIN
+from .const import PROPERTY_TO_ATTRIBUTE_NAME_MAP
+from .const import SIGNAL_OPTIONS_UPDATED
+from .projector.const import PROPERTY_AVAILABLE
+from .projector.const import PROPERTY_ERR
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def snake_to_title_words(string):
+    return " ".join(word.title() for word in string.split("_"))
+
+
+def get_entity_properties(config_entry):
+    """Get properties that have their own entity. Errors are always pushed."""
+    properties = set(config_entry.data[CONF_POLL_PROPERTIES])
+    properties.add(PROPERTY_ERR)
+    return [prop for prop in PROPERTY_TO_ATTRIBUTE_NAME_MAP if prop in properties]
+
+
+@callback
+def async_setup_property_entities(
+    hass, config_entry, async_add_entities, entity_class, descriptions
+):
+    """
+    Add an entity per property with a description.
+
+    Entities follow option changes: properties no longer polled have their
+    entity removed, along with its registry entry, and newly polled ones get
+    one added, without a reload.
+    """
+    projector = hass.data[DOMAIN][config_entry.entry_id]
+    entities = {}
+
+    @callback
+    def async_update_entities():
+        properties = [
+            prop for prop in get_entity_properties(config_entry) if prop in descriptions
+        ]
+        for prop in [prop for prop in entities if prop not in properties]:
+            entity = entities.pop(prop)
+            if entity.registry_entry:
+                # Removing the registry entry also removes the entity, instead
+                # of leaving it behind as unavailable
+                async_get_entity_registry(hass).async_remove(entity.entity_id)
+            else:
+                hass.async_create_task(entity.async_remove())
+        new_entities = []
+        for prop in properties:
+            if prop not in entities:
+                entities[prop] = entity_class(config_entry, projector, prop)
+                new_entities.append(entities[prop])
+        async_add_entities(new_entities)
+
+    async_update_entities()
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_OPTIONS_UPDATED.format(config_entry.entry_id),
+            async_update_entities,
+        )
+    )
+
+
+class EpsonProjectorEntity(Entity):
+    """Base entity of an Epson projector."""
+
+    _attr_should_poll = False
+
+    def __init__(self, config_entry, projector):
+        self._config_entry = config_entry
+        self._projector = projector
+
+    @property
+    def device_info(self):
+        """Get attributes about the device."""
+        if not self._config_entry.unique_id:
+            return None
+        return {
+            "identifiers": {(DOMAIN, self._config_entry.unique_id)},
+            "manufacturer": "Epson",
+            "name": self._config_entry.title,
+            "model": "Epson",
+        }
+
+    @property
+    def _optimistic(self):
+        # Read on use, since options are applied without recreating entities
+        return self._config_entry.data.get(CONF_OPTIMISTIC, False)
+
+    async def _async_set_property(self, prop, value):
+        return await self._projector.set_property(
+            prop, value, optimistic=self._optimistic
+        )
+
+
+class EpsonProjectorPropertyEntity(EpsonProjectorEntity):
+    """Base entity of a single projector property."""
+
+    def __init__(self, config_entry, projector, prop):
+        super().__init__(config_entry, projector)
+        attribute_name = PROPERTY_TO_ATTRIBUTE_NAME_MAP[prop]
+        self._prop = prop
+        self._attr_name = f"{config_entry.title} {snake_to_title_words(attribute_name)}"
+        self._attr_unique_id = f"{config_entry.unique_id}_{attribute_name}"
+
+    async def async_added_to_hass(self):
+        """Run when entity about to be added."""
+        await super().async_added_to_hass()
+        await self._async_restore_value()
+        self._update_value(self._projector.state.get(self._prop))
+        self._attr_available = self._projector.state.available is not False
+        self.async_on_remove(self._projector.add_callback(self._callback))
+
+    async def _async_restore_value(self):
+        """Restore the last value into the projector state if it is unknown."""
+
+    def _restore_value(self, value):
+        if value is not None and self._projector.state.get(self._prop) is None:
+            self._projector.state.set(self._prop, value)
+
+    def _callback(self, prop, value):
+        if prop == PROPERTY_AVAILABLE:
+            self._attr_available = value
+            self.async_write_ha_state()
+            return
+        if prop != self._prop:
+            return
+        _LOGGER.debug(
+            "_callback: unique_id=%s: value=%s",
+            self._attr_unique_id,
+            value,
+        )
+        self._update_value(value)
+        self.async_write_ha_state()
+
+    @abstractmethod
+    def _update_value(self, value):
+        """Update the entity attributes from a property value."""
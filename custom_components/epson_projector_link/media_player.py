@@ -4,7 +4,6 @@ import asyncio
 from datetime import timedelta
 import logging
 
-from homeassistant.components.media_player import DOMAIN as MEDIA_PLAYER_PLATFORM
 from homeassistant.components.media_player import MediaPlayerDeviceClass
 from homeassistant.components.media_player import MediaPlayerEntity
 from homeassistant.components.media_player.const import ATTR_INPUT_SOURCE_LIST
@@ -13,10 +12,11 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant
+from homeassistant.core import SupportsResponse
+from homeassistant.core import callback
 from homeassistant.helpers import entity_platform
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.restore_state import RestoreEntity
 import voluptuous as vol
@@ -24,16 +24,26 @@ import voluptuous as vol
 from .const import CONF_POLL_PROPERTIES
 from .const import CONF_PROPERTIES_SCAN_INTERVAL
 from .const import DOMAIN
+from .const import POLL_CYCLES
+from .const import POLL_POWER
+from .const import POLL_PROPERTIES
 from .const import POWER_TIMEOUT_RETRY_INTERVAL
+from .const import PROPERTY_BACKOFFS
 from .const import PROPERTY_TO_ATTRIBUTE_NAME_MAP
 from .const import SERVICE_LOAD_LENS_MEMORY
 from .const import SERVICE_LOAD_PICTURE_MEMORY
+from .const import SERVICE_RUN_SEQUENCE
 from .const import SERVICE_SELECT_AUTO_IRIS_MODE
 from .const import SERVICE_SELECT_COLOR_MODE
 from .const import SERVICE_SELECT_POWER_CONSUMPTION_MODE
 from .const import SERVICE_SEND_COMMAND
 from .const import SERVICE_SET_BRIGHTNESS
+from .const import SERVICE_STOP_KEY_STREAM
+from .const import SERVICE_STREAM_KEY
+from .const import SIGNAL_OPTIONS_UPDATED
 from .const import STATE_ERROR
+from .entity import EpsonProjectorEntity
+from .projector.coalescer import InputCoalescer
 from .projector.const import AUTO_IRIS_MODE_CODE_INVERTED_MAP
 from .projector.const import COLOR_MODE_CODE_INVERTED_MAP
 from .projector.const import COMMAND_LOAD_LENS_MEMORY
@@ -46,10 +56,16 @@ from .projector.const import COMMAND_MEDIA_PREVIOUS
 from .projector.const import COMMAND_MEDIA_STOP
 from .projector.const import COMMAND_MEDIA_VOL_DOWN
 from .projector.const import COMMAND_MEDIA_VOL_UP
+from .projector.const import KEY_MAX_PENDING
+from .projector.const import KEY_STREAM_DEFAULT_RATE
+from .projector.const import KEY_STREAM_MAX_DURATION
+from .projector.const import KEY_STREAM_MAX_IN_FLIGHT
+from .projector.const import KEY_STREAM_MAX_RATE
 from .projector.const import OFF
 from .projector.const import ON
 from .projector.const import POWER_CONSUMPTION_MODE_CODE_INVERTED_MAP
 from .projector.const import PROPERTY_AUTO_IRIS_MODE
+from .projector.const import PROPERTY_AVAILABLE
 from .projector.const import PROPERTY_BRIGHTNESS
 from .projector.const import PROPERTY_COLOR_MODE
 from .projector.const import PROPERTY_ERR
@@ -62,6 +78,11 @@ from .projector.const import PROPERTY_VOLUME
 from .projector.const import SOURCE_CODE_INVERTED_MAP
 from .projector.const import STATE_COOLDOWN
 from .projector.const import STATE_WARMUP
+from .projector.const import VOLUME_MAX
+from .projector.exceptions import ProjectorErrorResponse
+from .projector.exceptions import ProjectorQueueFull
+from .projector.exceptions import ProjectorRequestExpired
+from .projector.exceptions import ProjectorUnavailable
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -73,17 +94,11 @@ async def async_setup_entry(
     _LOGGER.debug("async_setup_entry: entry_id=%s", config_entry.entry_id)
     entry_id = config_entry.entry_id
     projector = hass.data[DOMAIN][entry_id]
-    scan_interval_power = _to_time_delta_seconds(config_entry.data[CONF_SCAN_INTERVAL])
-    scan_interval_properties = _to_time_delta_seconds(
-        config_entry.data[CONF_PROPERTIES_SCAN_INTERVAL]
-    )
     projector_entity = EpsonProjectorMediaPlayer(
-        hass=hass,
         config_entry=config_entry,
         projector=projector,
-        poll_properties=config_entry.data[CONF_POLL_PROPERTIES],
-        scan_interval_power=scan_interval_power,
-        scan_interval_properties=scan_interval_properties,
+        poll_cycles=hass.data[POLL_CYCLES][entry_id],
+        property_backoff=hass.data[PROPERTY_BACKOFFS][entry_id],
     )
     async_add_entities([projector_entity], True)
 
@@ -139,6 +154,27 @@ def _setup_services():
         },
         SERVICE_SELECT_POWER_CONSUMPTION_MODE,
     )
+    platform.async_register_entity_service(
+        SERVICE_RUN_SEQUENCE,
+        {
+            vol.Required("steps"): vol.All(
+                cv.ensure_list,
+                vol.Length(min=1),
+                [
+                    vol.All(
+                        {
+                            vol.Exclusive("command", "step"): cv.string,
+                            vol.Exclusive("property", "step"): cv.string,
+                            vol.Optional("value"): cv.string,
+                        },
+                        cv.has_at_least_one_key("command", "property"),
+                    )
+                ],
+            )
+        },
+        SERVICE_RUN_SEQUENCE,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
     platform.async_register_entity_service(
         SERVICE_SEND_COMMAND,
         {vol.Required("command"): str},
@@ -153,6 +189,28 @@ def _setup_services():
         },
         SERVICE_SET_BRIGHTNESS,
     )
+    platform.async_register_entity_service(
+        SERVICE_STREAM_KEY,
+        {
+            vol.Required("command"): cv.string,
+            vol.Optional("rate", default=KEY_STREAM_DEFAULT_RATE): vol.All(
+                vol.Coerce(float), vol.Range(min=0.5, max=KEY_STREAM_MAX_RATE)
+            ),
+            vol.Optional("duration"): vol.All(
+                vol.Coerce(float), vol.Range(min=0.1, max=KEY_STREAM_MAX_DURATION)
+            ),
+            vol.Optional("max_in_flight", default=KEY_STREAM_MAX_IN_FLIGHT): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=KEY_MAX_PENDING)
+            ),
+        },
+        SERVICE_STREAM_KEY,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    platform.async_register_entity_service(
+        SERVICE_STOP_KEY_STREAM,
+        {vol.Optional("command"): cv.string},
+        SERVICE_STOP_KEY_STREAM,
+    )
 
 
 def _to_time_delta_seconds(scan_interval):
@@ -163,19 +221,6 @@ def _to_time_delta_seconds(scan_interval):
     )
 
 
-async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
-    """Unload Epson Projector Home Cinema entry."""
-    _LOGGER.debug("async_unload_entry: entry_id=%s", config_entry.entry_id)
-    registry = async_get_entity_registry(hass)
-    entity_id = registry.async_get_entity_id(
-        MEDIA_PLAYER_PLATFORM, DOMAIN, config_entry.entry_id
-    )
-    projector_entity = registry.async_get(entity_id)
-    projector_entity.unload()
-
-    return True
-
-
 PROPERTY_TO_FEATURE_MAP = {
     PROPERTY_SOURCE: MediaPlayerEntityFeature.SELECT_SOURCE,
     PROPERTY_VOLUME: MediaPlayerEntityFeature.VOLUME_SET,
@@ -208,116 +253,200 @@ def _to_hex(integer):
     return "%0.2X" % integer
 
 
-class EpsonProjectorMediaPlayer(MediaPlayerEntity, RestoreEntity):
+class EpsonProjectorMediaPlayer(EpsonProjectorEntity, MediaPlayerEntity, RestoreEntity):
     """Representation of Epson Projector Home Cinema Device."""
 
-    def __init__(
-        self,
-        hass,
-        config_entry,
-        projector,
-        poll_properties,
-        scan_interval_power,
-        scan_interval_properties,
-    ):
+    def __init__(self, config_entry, projector, poll_cycles, property_backoff):
         """Initialize projector entity."""
         _LOGGER.debug("__init__: unique_id=%s", config_entry.unique_id)
-        self._config_entry = config_entry
-        self._projector = projector
-        self._poll_properties = poll_properties
+        super().__init__(config_entry, projector)
+        self._coalescer = InputCoalescer(projector)
+        self._power_poll = poll_cycles[POLL_POWER]
+        self._properties_poll = poll_cycles[POLL_PROPERTIES]
+        self._property_backoff = property_backoff
+        self._unsub_poll_timers = []
 
         self._attr_available = False
         self._attr_device_class = MediaPlayerDeviceClass.TV
-        self._attr_extra_state_attributes = {
-            PROPERTY_TO_ATTRIBUTE_NAME_MAP[PROPERTY_ERR]: None
-        }
-        self._attr_should_poll = False  # We do our own polling based on config setting
         self._attr_source_list = None
         self._attr_state = None
-        self._attr_supported_features = _get_supported_features(poll_properties)
         self._attr_translation_key = "projector"
+        self._apply_options(config_entry.data)
+
+    def _apply_options(self, data):
+        self._poll_properties = data[CONF_POLL_PROPERTIES]
+        self._scan_interval_power = _to_time_delta_seconds(data[CONF_SCAN_INTERVAL])
+        self._scan_interval_properties = _to_time_delta_seconds(
+            data[CONF_PROPERTIES_SCAN_INTERVAL]
+        )
+        self._coalescer.optimistic = self._optimistic
+        self._attr_supported_features = _get_supported_features(self._poll_properties)
+
+    async def async_added_to_hass(self):
+        """Run when entity about to be added."""
+        await super().async_added_to_hass()
 
-        projector.set_callback(self._callback)
+        # Callbacks and timers are removed with the entity on unload
+        self.async_on_remove(self._projector.add_callback(self._callback))
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OPTIONS_UPDATED.format(self._config_entry.entry_id),
+                self._async_options_updated,
+            )
+        )
+        self._schedule_polls()
+        self.async_on_remove(self._cancel_polls)
 
-        unregister_callbacks = []
-        if scan_interval_power is not None:
-            unregister_callbacks.append(
+        # Restore old state
+        old_state = await self.async_get_last_state()
+        if old_state is not None:
+            self._attr_source_list = old_state.attributes.get(ATTR_INPUT_SOURCE_LIST)
+            if self._projector.state.source_list is None:
+                self._projector.state.source_list = self._attr_source_list
+            self.async_write_ha_state()
+
+    def _schedule_polls(self):
+        if self._scan_interval_power is not None:
+            self._unsub_poll_timers.append(
                 async_track_time_interval(
-                    hass,
+                    self.hass,
                     self._async_get_power_callback,
-                    scan_interval_power,
+                    self._scan_interval_power,
                 )
             )
-
-        if scan_interval_properties is not None and len(poll_properties) > 0:
-            unregister_callbacks.append(
+        if (
+            self._scan_interval_properties is not None
+            and len(self._poll_properties) > 0
+        ):
+            self._unsub_poll_timers.append(
                 async_track_time_interval(
-                    hass,
+                    self.hass,
                     self._update_additional_attributes_callback,
-                    scan_interval_properties,
+                    self._scan_interval_properties,
                 )
             )
-        self._unregister_callbacks = unregister_callbacks
-
-    async def async_added_to_hass(self):
-        """Run when entity about to be added."""
-        await super().async_added_to_hass()
 
-        # Restore old state
-        old_state = await self.async_get_last_state()
-        if old_state is not None:
-            self._attr_source_list = old_state.attributes.get(ATTR_INPUT_SOURCE_LIST)
+    def _cancel_polls(self):
+        for unsub in self._unsub_poll_timers:
+            unsub()
+        self._unsub_poll_timers.clear()
 
-            for attribute in PROPERTY_TO_ATTRIBUTE_NAME_MAP.values():
-                value = old_state.attributes.get(attribute)
-                if value is not None:
-                    self._attr_extra_state_attributes[attribute] = value
-            self.async_write_ha_state()
+    @callback
+    def _async_options_updated(self):
+        """Apply changed options in place, keeping the connection and state."""
+        _LOGGER.debug(
+            "_async_options_updated: unique_id=%s", self._config_entry.unique_id
+        )
+        old_poll_properties = self._poll_properties
+        self._cancel_polls()
+        self._apply_options(self._config_entry.data)
+        self._schedule_polls()
+        if (
+            self._attr_state == STATE_ON
+            and self._poll_properties != old_poll_properties
+        ):
+            self.update_additional_attributes()
+        self.async_write_ha_state()
 
-    def unload(self):
-        """Unload projector entity."""
-        for callback in self._unregister_callbacks:
-            callback()
-        self._unregister_callbacks.clear()
+    async def async_will_remove_from_hass(self):
+        """Run when entity will be removed."""
+        self._coalescer.cancel()
 
     async def async_update(self):
         """Update state."""
         _LOGGER.debug("async_update: unique_id=%s", self._config_entry.unique_id)
         await self.async_get_power()
 
-    async def _async_get_power_callback(self, now=None):
-        return await self.async_get_power()
+    def _async_get_power_callback(self, now=None):
+        self._power_poll.tick(self._async_poll_power)
 
     async def async_get_power(self):
-        try:
-            self._attr_state = await self._projector.get_property(PROPERTY_POWER)
-            return self._attr_state
-        except asyncio.TimeoutError:
-            async_call_later(
-                self.hass, POWER_TIMEOUT_RETRY_INTERVAL, self._async_get_power_callback
-            )
-        except Exception as err:
-            _LOGGER.debug("async_get_power: Error getting power error=%s", err)
-            self._attr_available = False
-            raise
+        """Get power, sharing the power poll cycle if one is running."""
+        return await self._power_poll.async_run(self._async_poll_power)
+
+    async def _async_poll_power(self):
+        # Retries on timeout are part of the same poll cycle
+        while True:
+            try:
+                power = await self._projector.get_property(PROPERTY_POWER)
+                # Unchanged power isn't pushed to the callback, so update here too
+                self._update_power(power)
+                return power
+            except ProjectorUnavailable as err:
+                # Availability is updated when the projector is reachable again
+                _LOGGER.debug("async_get_power: %s", err)
+                self._attr_available = False
+                return None
+            except ProjectorQueueFull as err:
+                _LOGGER.debug("async_get_power: %s", err)
+                return None
+            except asyncio.TimeoutError:
+                _LOGGER.debug(
+                    "async_get_power: Timed out, retrying in %s",
+                    POWER_TIMEOUT_RETRY_INTERVAL,
+                )
+                await asyncio.sleep(POWER_TIMEOUT_RETRY_INTERVAL.total_seconds())
+            except Exception as err:
+                _LOGGER.debug("async_get_power: Error getting power error=%s", err)
+                self._attr_available = False
+                raise
 
     def _update_additional_attributes_callback(self, now):
-        return self.update_additional_attributes()
+        self._properties_poll.tick(self._async_poll_properties)
 
     def update_additional_attributes(self):
-        """Poll additional attributes"""
+        """Poll additional attributes, sharing the poll cycle if one is running"""
+        self.hass.async_create_task(
+            self._properties_poll.async_run(self._async_poll_properties)
+        )
+
+    async def _async_poll_properties(self):
+        props = []
         if PROPERTY_SOURCE in self._poll_properties and self._attr_source_list is None:
-            self.hass.create_task(self.async_try_get_property(PROPERTY_SOURCE_LIST))
+            props.append(PROPERTY_SOURCE_LIST)
 
         if self._attr_state == STATE_ON:
             for prop in self._poll_properties:
                 # Avoid double pulling the source list
-                if prop != PROPERTY_SOURCE:
-                    self.hass.create_task(self.async_try_get_property(prop))
+                if prop != PROPERTY_SOURCE and not self._was_recently_set(prop):
+                    props.append(prop)
+
+        # Skip properties that keep failing, e.g. ones the projector doesn't support
+        props = [prop for prop in props if self._property_backoff.should_poll(prop)]
+        await asyncio.gather(*(self.async_try_get_property(prop) for prop in props))
+
+    def _was_recently_set(self, prop):
+        # No need to verify a property whose set was ACKed since the last poll
+        seconds_since_set = self._projector.seconds_since_set(prop)
+        return (
+            seconds_since_set is not None
+            and self._scan_interval_properties is not None
+            and seconds_since_set < self._scan_interval_properties.total_seconds()
+        )
 
     async def async_try_get_property(self, prop):
+        # Polls are stale after a scan interval, and give way to user requests
+        deadline = (
+            None
+            if self._scan_interval_properties is None
+            else self._scan_interval_properties.total_seconds()
+        )
         try:
-            return await self._projector.get_property(prop)
+            value = await self._projector.get_property(
+                prop, background=True, deadline=deadline
+            )
+        except (
+            ProjectorQueueFull,
+            ProjectorRequestExpired,
+            ProjectorUnavailable,
+        ) as err:
+            _LOGGER.debug("async_try_get_property: %s", err)
+            return None
+        except (ProjectorErrorResponse, asyncio.TimeoutError) as err:
+            # Projector may not support it, so back off instead of warning
+            self._property_backoff.record_failure(prop, err)
+            return None
         except Exception as err:
             _LOGGER.warning(
                 "async_try_get_property: unique_id=%s: Error getting property=%s. Projector may not support it: %s",
@@ -325,19 +454,9 @@ class EpsonProjectorMediaPlayer(MediaPlayerEntity, RestoreEntity):
                 prop,
                 err,
             )
-
-    @property
-    def device_info(self):
-        """Get attributes about the device."""
-        if not self._attr_unique_id:
             return None
-        return {
-            "identifiers": {(DOMAIN, self._attr_unique_id)},
-            "manufacturer": "Epson",
-            "name": "Epson Projector Home Cinema",
-            "model": "Epson",
-            "via_hub": (DOMAIN, self._attr_unique_id),
-        }
+        self._property_backoff.record_success(prop)
+        return value
 
     @property
     def name(self):
@@ -359,42 +478,43 @@ class EpsonProjectorMediaPlayer(MediaPlayerEntity, RestoreEntity):
         source_code = SOURCE_CODE_INVERTED_MAP.get(source)
         if source_code is None:
             source_code = source
-        await self._projector.set_property(PROPERTY_SOURCE, source_code)
+        await self._async_set_property(PROPERTY_SOURCE, source_code)
 
     async def async_set_volume_level(self, volume):
-        await self._projector.set_property(PROPERTY_VOLUME, int(volume * 100))
+        await self._coalescer.set_volume(int(volume * VOLUME_MAX))
 
     async def async_mute_volume(self, mute):
-        if (
-            PROPERTY_TO_ATTRIBUTE_NAME_MAP[PROPERTY_MUTE]
-            in self._attr_extra_state_attributes
-        ):
+        if self._projector.state.mute is not None:
             # Projector supports mute state
-            await self._projector.set_property(PROPERTY_MUTE, ON if mute else OFF)
+            await self._async_set_property(PROPERTY_MUTE, ON if mute else OFF)
         else:
             # In this case we don't know the current mute state so this is a toggle
-            await self._projector.send_command(COMMAND_MEDIA_MUTE)
+            await self._coalescer.send_key(COMMAND_MEDIA_MUTE)
 
     async def async_volume_up(self):
-        await self._projector.send_command(COMMAND_MEDIA_VOL_UP)
+        # Each press is one projector volume unit, like the native key. Presses
+        # are folded into an absolute volume if volume is known
+        if not await self._coalescer.step_volume(1):
+            await self._coalescer.send_key(COMMAND_MEDIA_VOL_UP)
 
     async def async_volume_down(self):
-        await self._projector.send_command(COMMAND_MEDIA_VOL_DOWN)
+        if not await self._coalescer.step_volume(-1):
+            await self._coalescer.send_key(COMMAND_MEDIA_VOL_DOWN)
 
     async def async_media_pause(self):
-        await self._projector.send_command(COMMAND_MEDIA_PAUSE)
+        await self._coalescer.send_key(COMMAND_MEDIA_PAUSE)
 
     async def async_media_play(self):
-        await self._projector.send_command(COMMAND_MEDIA_PLAY)
+        await self._coalescer.send_key(COMMAND_MEDIA_PLAY)
 
     async def async_media_stop(self):
-        await self._projector.send_command(COMMAND_MEDIA_STOP)
+        await self._coalescer.send_key(COMMAND_MEDIA_STOP)
 
     async def async_media_next_track(self):
-        await self._projector.send_command(COMMAND_MEDIA_NEXT)
+        await self._coalescer.send_key(COMMAND_MEDIA_NEXT)
 
     async def async_media_previous_track(self):
-        await self._projector.send_command(COMMAND_MEDIA_PREVIOUS)
+        await self._coalescer.send_key(COMMAND_MEDIA_PREVIOUS)
 
     #
     # Custom Services
@@ -413,55 +533,98 @@ class EpsonProjectorMediaPlayer(MediaPlayerEntity, RestoreEntity):
         )
 
     async def select_auto_iris_mode(self, auto_iris_mode):
-        await self._projector.set_property(
+        await self._async_set_property(
             PROPERTY_AUTO_IRIS_MODE, AUTO_IRIS_MODE_CODE_INVERTED_MAP[auto_iris_mode]
         )
 
     async def select_color_mode(self, color_mode):
-        await self._projector.set_property(
+        await self._async_set_property(
             PROPERTY_COLOR_MODE, COLOR_MODE_CODE_INVERTED_MAP[color_mode]
         )
 
     async def select_power_consumption_mode(self, power_consumption_mode):
-        await self._projector.set_property(
+        await self._async_set_property(
             PROPERTY_POWER_CONSUMPTION_MODE,
             POWER_CONSUMPTION_MODE_CODE_INVERTED_MAP[power_consumption_mode],
         )
 
     async def set_brightness(self, brightness):
-        await self._projector.set_property(PROPERTY_BRIGHTNESS, brightness)
+        await self._async_set_property(PROPERTY_BRIGHTNESS, brightness)
+
+    async def run_sequence(self, steps):
+        requests = []
+        for step in steps:
+            command = step.get("command")
+            if command is not None:
+                requests.append((command, None))
+            elif step.get("value") is None:
+                requests.append((f"{step['property']}?", None))
+            else:
+                requests.append((f"{step['property']} {step['value']}", step["value"]))
+
+        results = await self._projector.run_sequence(requests)
+        failed_step = next(
+            (i for i, result in enumerate(results) if not result["success"]), None
+        )
+        if failed_step is not None:
+            _LOGGER.warning(
+                "run_sequence: unique_id=%s: Step %d failed: %s",
+                self._config_entry.unique_id,
+                failed_step,
+                results[failed_step]["error"],
+            )
+        return {
+            "success": failed_step is None,
+            "failed_step": failed_step,
+            "steps": results,
+        }
 
     async def send_command(self, command):
         await self._projector.send_command(command)
 
+    async def stream_key(self, command, rate, max_in_flight, duration=None):
+        return await self._coalescer.stream_key(command, rate, duration, max_in_flight)
+
+    async def stop_key_stream(self, command=None):
+        self._coalescer.stop_key_stream(command)
+
     def _callback(self, prop, value):
         if prop == PROPERTY_POWER:
             return self._update_power(value)
+        if prop == PROPERTY_AVAILABLE:
+            if value:
+                # Available once power is known again
+                self._power_poll.start(self._async_poll_power)
+            else:
+                self._attr_available = False
+                self._update_ha()
+            return
         if prop == PROPERTY_SOURCE_LIST:
             self._attr_source_list = value
             return
 
-        attribute_name = PROPERTY_TO_ATTRIBUTE_NAME_MAP.get(prop)
-        if attribute_name is None:
-            _LOGGER.warning(
-                "_callback: unique_id=%s: Unsupported prop=%s value=%s",
-                self._config_entry.unique_id,
-                prop,
-                value,
+        # Other properties have their own sensor or select entity
+        if prop == PROPERTY_SOURCE:
+            self._attr_source = value
+        elif prop == PROPERTY_VOLUME:
+            self._attr_volume_level = (
+                None if value is None else min(value / VOLUME_MAX, 1)
             )
+        elif prop == PROPERTY_MUTE:
+            self._attr_is_volume_muted = value
+        elif prop == PROPERTY_ERR and (
+            self._attr_state is STATE_WARMUP or self._attr_state is STATE_COOLDOWN
+        ):
+            self._attr_state = STATE_ERROR
+        else:
             return
 
         _LOGGER.debug(
-            "_callback: unique_id=%s: attr=%s, value=%s",
+            "_callback: unique_id=%s: prop=%s, value=%s",
             self._config_entry.unique_id,
-            attribute_name,
+            prop,
             value,
         )
-        self._attr_extra_state_attributes[attribute_name] = value
-        if prop == PROPERTY_ERR and (
-            self._attr_state is STATE_WARMUP or self._attr_state is STATE_COOLDOWN
-        ):
-            self._attr_state = STATE_ERROR
         self._update_ha()
 
     def _update_power(self, value):
@@ -479,6 +642,9 @@ class EpsonProjectorMediaPlayer(MediaPlayerEntity, RestoreEntity):
         if self._attr_state == STATE_ON and (
             prev_state != STATE_ON or not prev_available
         ):
+            if prev_state != STATE_ON:
+                # Properties may be supported in the new power state or source
+                self._property_backoff.reprobe()
             self.update_additional_attributes()
         self._update_ha()
 
@@ -0,0 +1,219 @@
+"""Poll cycles for the epson integration."""
+
+import asyncio
+import logging
+import math
+import time
+
+from .const import PROPERTY_BACKOFF_INITIAL_DELAY
+from .const import PROPERTY_BACKOFF_MAX_DELAY
+from .const import PROPERTY_REPROBE_INTERVAL
+from .const import PROPERTY_UNSUPPORTED_THRESHOLD
+from .projector.history import RunningStats
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the poll cycle duration histogram buckets
+POLL_DURATION_BUCKETS = (0.1, 0.5, 1, 5, 10, 30, 60, math.inf)
+
+PROPERTY_STATUS_BACKOFF = "backoff"
+PROPERTY_STATUS_OK = "ok"
+PROPERTY_STATUS_UNSUPPORTED = "unsupported"
+
+
+class PollCycle:
+    """
+    Runs a poll as a single-flight unit of work.
+
+    A timer tick while the previous cycle is still running is skipped and
+    counted, and the running cycle is counted as an overrun. Callers that ask
+    for a cycle while one is running share the running one instead.
+    """
+
+    def __init__(self, hass, name):
+        self._hass = hass
+        self._name = name
+        self._task = None
+        self._overran = False
+        self._cycle_count = 0
+        self._overrun_count = 0
+        self._skipped_tick_count = 0
+        self._durations = RunningStats(POLL_DURATION_BUCKETS)
+
+    @property
+    def is_running(self):
+        return self._task is not None and not self._task.done()
+
+    def tick(self, poll):
+        """Start a cycle from a timer, unless the previous one is still running."""
+        if self.is_running:
+            self._skipped_tick_count += 1
+            if not self._overran:
+                self._overran = True
+                self._overrun_count += 1
+            _LOGGER.debug(
+                "tick: Skipping %s poll since previous cycle is still running",
+                self._name,
+            )
+            return
+        self._start(poll)
+
+    def start(self, poll):
+        """Start a cycle without waiting for it, unless one is running."""
+        if not self.is_running:
+            self._start(poll)
+
+    async def async_run(self, poll):
+        """Run a cycle, or wait for the running one. Returns the poll result."""
+        if not self.is_running:
+            self._start(poll)
+        return await asyncio.shield(self._task)
+
+    def cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    def _start(self, poll):
+        self._overran = False
+        self._task = self._hass.async_create_task(self._async_run_cycle(poll))
+        self._task.add_done_callback(self._log_failure)
+
+    def _log_failure(self, task):
+        # Cycles started without a waiter would otherwise never have their
+        # error retrieved. Waiters still get the error raised.
+        if not task.cancelled() and task.exception() is not None:
+            _LOGGER.debug(
+                "_log_failure: %s poll failed: %s", self._name, task.exception()
+            )
+
+    async def _async_run_cycle(self, poll):
+        start = time.monotonic()
+        try:
+            return await poll()
+        finally:
+            self._cycle_count += 1
+            self._durations.add(round(time.monotonic() - start, 3))
+
+    def as_dict(self):
+        return {
+            "running": self.is_running,
+            "cycle_count": self._cycle_count,
+            "overrun_count": self._overrun_count,
+            "skipped_tick_count": self._skipped_tick_count,
+            "duration": self._durations.as_dict(),
+        }
+
+
+class _PropertyFailures:
+    __slots__ = ("failures", "total_failures", "unsupported", "retry_time", "error")
+
+    def __init__(self):
+        self.failures = 0
+        self.total_failures = 0
+        self.unsupported = False
+        self.retry_time = None
+        self.error = None
+
+
+class PropertyBackoff:
+    """
+    Tracks failures of each polled property to stop polling doomed ones.
+
+    Each consecutive failure doubles how long the property is skipped, from
+    initial_delay up to max_delay seconds. After unsupported_threshold
+    consecutive failures it is marked unsupported, and only probed again after
+    reprobe_interval seconds or on reprobe(), e.g. when the projector powers
+    on. A success resets the property.
+    """
+
+    def __init__(
+        self,
+        initial_delay=PROPERTY_BACKOFF_INITIAL_DELAY,
+        max_delay=PROPERTY_BACKOFF_MAX_DELAY,
+        unsupported_threshold=PROPERTY_UNSUPPORTED_THRESHOLD,
+        reprobe_interval=PROPERTY_REPROBE_INTERVAL,
+    ):
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._unsupported_threshold = unsupported_threshold
+        self._reprobe_interval = reprobe_interval
+        self._properties = {}
+
+    def should_poll(self, prop):
+        """Whether the property is due to be polled."""
+        failures = self._properties.get(prop)
+        return (
+            failures is None
+            or failures.retry_time is None
+            or time.monotonic() >= failures.retry_time
+        )
+
+    def record_success(self, prop):
+        failures = self._properties.get(prop)
+        if failures is None or failures.failures == 0:
+            return
+        if failures.unsupported:
+            _LOGGER.info("record_success: property=%s is supported again", prop)
+        failures.failures = 0
+        failures.unsupported = False
+        failures.retry_time = None
+
+    def record_failure(self, prop, err):
+        """Back off polling the property. Returns whether it is unsupported."""
+        failures = self._properties.setdefault(prop, _PropertyFailures())
+        failures.failures += 1
+        failures.total_failures += 1
+        failures.error = repr(err)
+        if failures.failures >= self._unsupported_threshold:
+            if not failures.unsupported:
+                _LOGGER.warning(
+                    "record_failure: Marking property=%s unsupported after %d failures, probing again in %ds: %s",
+                    prop,
+                    failures.failures,
+                    self._reprobe_interval,
+                    err,
+                )
+            failures.unsupported = True
+            delay = self._reprobe_interval
+        else:
+            delay = min(
+                self._initial_delay * 2 ** (failures.failures - 1), self._max_delay
+            )
+            _LOGGER.debug(
+                "record_failure: Backing off property=%s for %ds: %s",
+                prop,
+                delay,
+                err,
+            )
+        failures.retry_time = time.monotonic() + delay
+        return failures.unsupported
+
+    def reprobe(self):
+        """Make every backed off or unsupported property due now."""
+        for failures in self._properties.values():
+            failures.retry_time = None
+
+    def as_dict(self):
+        now = time.monotonic()
+        return {
+            prop: {
+                "status": (
+                    PROPERTY_STATUS_UNSUPPORTED
+                    if failures.unsupported
+                    else (
+                        PROPERTY_STATUS_BACKOFF
+                        if failures.failures > 0
+                        else PROPERTY_STATUS_OK
+                    )
+                ),
+                "failures": failures.failures,
+                "total_failures": failures.total_failures,
+                "retry_in": (
+                    None
+                    if failures.retry_time is None
+                    else max(round(failures.retry_time - now, 3), 0)
+                ),
+                "last_error": failures.error,
+            }
+            for prop, failures in self._properties.items()
+        }
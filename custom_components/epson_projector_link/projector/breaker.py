@@ -0,0 +1,61 @@
+"""Circuit breaker of Epson projector module."""
+
+BREAKER_CLOSED = "closed"
+BREAKER_HALF_OPEN = "half_open"
+BREAKER_OPEN = "open"
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failures to decide whether the projector is reachable.
+
+    Closed lets requests through. After failure_threshold consecutive failures
+    it opens, and requests should fail fast. Half open is while a single probe
+    checks the projector, which closes it on success or reopens it on failure.
+    """
+
+    def __init__(self, failure_threshold):
+        self._failure_threshold = failure_threshold
+        self._state = BREAKER_CLOSED
+        self._failures = 0
+        self._open_count = 0
+
+    @property
+    def state(self):
+        return self._state
+
+    @property
+    def is_closed(self):
+        return self._state == BREAKER_CLOSED
+
+    def record_success(self):
+        """Record a success. Returns whether the breaker closed."""
+        self._failures = 0
+        if self._state == BREAKER_CLOSED:
+            return False
+        self._state = BREAKER_CLOSED
+        return True
+
+    def record_failure(self):
+        """Record a failure. Returns whether the breaker opened."""
+        self._failures += 1
+        if self._state == BREAKER_OPEN:
+            return False
+        if self._state == BREAKER_CLOSED and self._failures < self._failure_threshold:
+            return False
+        was_closed = self._state == BREAKER_CLOSED
+        self._state = BREAKER_OPEN
+        if was_closed:
+            self._open_count += 1
+        return was_closed
+
+    def half_open(self):
+        if self._state == BREAKER_OPEN:
+            self._state = BREAKER_HALF_OPEN
+
+    def as_dict(self):
+        return {
+            "state": self._state,
+            "consecutive_failures": self._failures,
+            "open_count": self._open_count,
+        }
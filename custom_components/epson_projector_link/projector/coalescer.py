@@ -0,0 +1,206 @@
+"""Coalescing of bursty inputs in front of an Epson projector."""
+
+import asyncio
+import logging
+
+import async_timeout
+
+from .const import KEY_MAX_PENDING
+from .const import KEY_REPEAT_INTERVAL
+from .const import KEY_STREAM_MAX_DURATION
+from .const import KEY_STREAM_MAX_IN_FLIGHT
+from .const import PROPERTY_VOLUME
+from .const import VOLUME_MAX
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class InputCoalescer:
+    """
+    Folds bursts of volume changes and key presses into fewer requests.
+
+    Volume sets are last value wins, with at most one set in flight. Relative
+    volume steps are folded into an absolute set when the volume is known. Key
+    presses are sent at most once per key_interval, with at most
+    max_pending_keys presses of each key waiting. Key streams repeat a key at
+    a fixed rate until stopped, e.g. while a lens adjustment button is held.
+    """
+
+    def __init__(
+        self,
+        projector,
+        key_interval=KEY_REPEAT_INTERVAL,
+        max_pending_keys=KEY_MAX_PENDING,
+        optimistic=False,
+    ):
+        self._projector = projector
+        # Public, since options can change while inputs are being coalesced
+        self.optimistic = optimistic
+        self._key_interval = key_interval
+        self._max_pending_keys = max_pending_keys
+        self._target_volume = None
+        self._volume_task = None
+        self._pending_keys = {}
+        self._key_tasks = {}
+        self._key_streams = {}
+
+    def cancel(self):
+        """Cancel volume sets and key presses not sent yet, and stop key streams."""
+        for task in (self._volume_task, *self._key_tasks.values()):
+            if task is not None:
+                task.cancel()
+        self.stop_key_stream()
+
+    async def set_volume(self, volume):
+        """Set volume, replacing any set that has not been sent yet."""
+        self._target_volume = max(0, min(VOLUME_MAX, volume))
+        if self._volume_task is None or self._volume_task.done():
+            self._volume_task = asyncio.create_task(self._send_volume())
+        await asyncio.shield(self._volume_task)
+
+    async def step_volume(self, steps):
+        """
+        Step volume relative to the latest volume.
+
+        :param int steps:   Amount to change volume by, in projector volume units
+        :return bool:       False if volume is unknown, so it can't be stepped
+        """
+        volume = self._target_volume
+        if volume is None:
+            volume = self._projector.state.volume
+        if volume is None:
+            return False
+        await self.set_volume(volume + steps)
+        return True
+
+    async def _send_volume(self):
+        sent_volume = None
+        try:
+            while self._target_volume != sent_volume:
+                sent_volume = self._target_volume
+                _LOGGER.debug("_send_volume: volume=%s", sent_volume)
+                await self._projector.set_property(
+                    PROPERTY_VOLUME, str(sent_volume), optimistic=self.optimistic
+                )
+        finally:
+            self._target_volume = None
+
+    async def send_key(self, command):
+        """Send key command, rate limited and dropping presses over the limit."""
+        pending = self._pending_keys.get(command, 0)
+        if pending >= self._max_pending_keys:
+            _LOGGER.debug('send_key: Dropping command="%s" press', command)
+        else:
+            self._pending_keys[command] = pending + 1
+
+        task = self._key_tasks.get(command)
+        if task is None or task.done():
+            task = asyncio.create_task(self._send_keys(command))
+            self._key_tasks[command] = task
+        await asyncio.shield(task)
+
+    async def _send_keys(self, command):
+        try:
+            while self._pending_keys.get(command, 0) > 0:
+                self._pending_keys[command] -= 1
+                await asyncio.gather(
+                    self._projector.send_command(command),
+                    asyncio.sleep(self._key_interval),
+                )
+        finally:
+            self._pending_keys.pop(command, None)
+
+    async def stream_key(
+        self,
+        command,
+        rate,
+        duration=None,
+        max_in_flight=KEY_STREAM_MAX_IN_FLIGHT,
+    ):
+        """
+        Repeat key command at rate per second until stopped or duration passes.
+
+        At most max_in_flight commands are queued or waiting for a response.
+        Ticks at the limit are dropped instead of building a backlog, so the
+        key stops repeating as soon as the stream is stopped. Streams wait for
+        the lens to settle after a lens memory is loaded.
+
+        :param float duration:  Seconds to stream for, or None until stopped,
+                                at most KEY_STREAM_MAX_DURATION
+        :return dict:           Counts of sent, dropped and failed commands,
+                                duration in seconds and achieved rate per second
+        """
+        self.stop_key_stream(command)
+        stop = self._key_streams[command] = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        stats = {"sent": 0, "dropped": 0, "failed": 0}
+        in_flight = set()
+
+        def on_done(task):
+            in_flight.discard(task)
+            if task.cancelled():
+                stats["dropped"] += 1
+            elif task.exception() is not None:
+                stats["failed"] += 1
+            else:
+                stats["sent"] += 1
+
+        async def wait_stopped(timeout):
+            try:
+                async with async_timeout.timeout(max(0, timeout)):
+                    await stop.wait()
+            except asyncio.TimeoutError:
+                pass
+
+        settle_time = self._projector.lens_settle_time_left()
+        if settle_time > 0:
+            _LOGGER.debug(
+                'stream_key: command="%s" waiting %.1fs for lens to settle',
+                command,
+                settle_time,
+            )
+            await wait_stopped(settle_time)
+
+        duration = min(duration or KEY_STREAM_MAX_DURATION, KEY_STREAM_MAX_DURATION)
+        start_time = loop.time()
+        end_time = start_time + duration
+        next_time = start_time
+        try:
+            while not stop.is_set() and loop.time() < end_time:
+                if len(in_flight) < max_in_flight:
+                    # Each tick is a press, so it must not share a queued response
+                    task = asyncio.create_task(
+                        self._projector.send_command(command, coalesce=False)
+                    )
+                    in_flight.add(task)
+                    task.add_done_callback(on_done)
+                else:
+                    stats["dropped"] += 1
+                next_time += 1 / rate
+                await wait_stopped(min(next_time, end_time) - loop.time())
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            if self._key_streams.get(command) is stop:
+                del self._key_streams[command]
+            if stop.is_set():
+                # Commands that were sent still get their response
+                for task in in_flight:
+                    task.cancel()
+            if in_flight:
+                await asyncio.wait(in_flight)
+
+        elapsed = loop.time() - start_time
+        _LOGGER.debug('stream_key: command="%s" %s', command, stats)
+        return {
+            **stats,
+            "duration": round(elapsed, 3),
+            "rate": round(stats["sent"] / elapsed, 2) if elapsed > 0 else 0,
+        }
+
+    def stop_key_stream(self, command=None):
+        """Stop the stream of key command, or all streams if None."""
+        for key, stop in list(self._key_streams.items()):
+            if command is None or key == command:
+                stop.set()
@@ -0,0 +1,164 @@
+"""Encoding and decoding of ESC/VP21 frames for Epson projector module."""
+
+from functools import lru_cache
+import logging
+import sys
+
+from .const import AUTO_IRIS_MODE_CODE_MAP
+from .const import COLOR_MODE_CODE_MAP
+from .const import COMMAND_MEDIA_MUTE
+from .const import COMMAND_MEDIA_NEXT
+from .const import COMMAND_MEDIA_PAUSE
+from .const import COMMAND_MEDIA_PLAY
+from .const import COMMAND_MEDIA_PREVIOUS
+from .const import COMMAND_MEDIA_STOP
+from .const import COMMAND_MEDIA_VOL_DOWN
+from .const import COMMAND_MEDIA_VOL_UP
+from .const import IMEVENT_ALARM_BIT_MAP
+from .const import IMEVENT_WARNING_BIT_MAP
+from .const import ON
+from .const import POWER_CODE_MAP
+from .const import POWER_CONSUMPTION_MODE_CODE_MAP
+from .const import PROPERTY_AUTO_IRIS_MODE
+from .const import PROPERTY_BRIGHTNESS
+from .const import PROPERTY_COLOR_MODE
+from .const import PROPERTY_ERR
+from .const import PROPERTY_ERR_CODE_MAP
+from .const import PROPERTY_LAMP_HOURS
+from .const import PROPERTY_MUTE
+from .const import PROPERTY_POWER
+from .const import PROPERTY_POWER_CONSUMPTION_MODE
+from .const import PROPERTY_SERIAL_NUMBER
+from .const import PROPERTY_SOURCE
+from .const import PROPERTY_SOURCE_LIST
+from .const import PROPERTY_VOLUME
+from .const import SOURCE_CODE_MAP
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def hex_string_to_int(string):
+    return int(string, 16)
+
+
+#
+# Encoding
+#
+
+# Commands sent on every poll or key press, which are encoded ahead of time
+FIXED_COMMANDS = [
+    f"{prop}?"
+    for prop in (
+        PROPERTY_AUTO_IRIS_MODE,
+        PROPERTY_BRIGHTNESS,
+        PROPERTY_COLOR_MODE,
+        PROPERTY_ERR,
+        PROPERTY_LAMP_HOURS,
+        PROPERTY_MUTE,
+        PROPERTY_POWER,
+        PROPERTY_POWER_CONSUMPTION_MODE,
+        PROPERTY_SERIAL_NUMBER,
+        PROPERTY_SOURCE,
+        PROPERTY_SOURCE_LIST,
+        PROPERTY_VOLUME,
+    )
+] + [
+    COMMAND_MEDIA_MUTE,
+    COMMAND_MEDIA_NEXT,
+    COMMAND_MEDIA_PAUSE,
+    COMMAND_MEDIA_PLAY,
+    COMMAND_MEDIA_PREVIOUS,
+    COMMAND_MEDIA_STOP,
+    COMMAND_MEDIA_VOL_DOWN,
+    COMMAND_MEDIA_VOL_UP,
+]
+
+
+@lru_cache(maxsize=256)
+def encode_command(command):
+    """Encode command to the bytes written to the projector."""
+    return f"{command}\r".encode()
+
+
+for _command in FIXED_COMMANDS:
+    encode_command(_command)
+
+
+#
+# Bitmasks
+#
+
+
+def _create_bitmask_table(bit_map):
+    """Create table of the names set in every 8 bit bitmask."""
+    return tuple(
+        tuple(name for bit, name in sorted(bit_map.items()) if mask & (1 << bit))
+        for mask in range(256)
+    )
+
+
+# All warning and alarm bits fit in the low byte
+_WARNING_TABLE = _create_bitmask_table(IMEVENT_WARNING_BIT_MAP)
+_ALARM_TABLE = _create_bitmask_table(IMEVENT_ALARM_BIT_MAP)
+
+
+def decode_warnings(bitmask):
+    """Return tuple of warning names set in IMEVENT warning bitmask."""
+    return _WARNING_TABLE[bitmask & 0xFF]
+
+
+def decode_alarms(bitmask):
+    """Return tuple of alarm names set in IMEVENT alarm bitmask."""
+    return _ALARM_TABLE[bitmask & 0xFF]
+
+
+#
+# Properties
+#
+
+
+def _get_source_name(code):
+    source_name = SOURCE_CODE_MAP.get(code)
+    return sys.intern(code) if source_name is None else source_name
+
+
+def _parse_source_list(response):
+    parts = response.split(" ")
+    if len(parts) % 2 == 1:
+        _LOGGER.error(
+            "_parse_source_list: Source list response has odd number of values. response=%s",
+            response,
+        )
+    sources = []
+    for i in range(len(parts) // 2):
+        sources.append(_get_source_name(parts[2 * i]))
+    return sources
+
+
+POWER_PARSER = POWER_CODE_MAP.get
+PROPERTY_PARSER_MAP = {
+    PROPERTY_AUTO_IRIS_MODE: AUTO_IRIS_MODE_CODE_MAP.get,
+    PROPERTY_COLOR_MODE: COLOR_MODE_CODE_MAP.get,
+    PROPERTY_ERR: PROPERTY_ERR_CODE_MAP.get,
+    PROPERTY_LAMP_HOURS: int,
+    PROPERTY_BRIGHTNESS: int,
+    PROPERTY_MUTE: lambda v: v == ON,
+    PROPERTY_POWER: POWER_PARSER,
+    PROPERTY_POWER_CONSUMPTION_MODE: POWER_CONSUMPTION_MODE_CODE_MAP.get,
+    PROPERTY_SOURCE: _get_source_name,
+    PROPERTY_SOURCE_LIST: _parse_source_list,
+    PROPERTY_VOLUME: int,
+}
+
+
+def decode_property(prop, value):
+    """
+    Decode property value from projector response.
+
+    Code values decode to the shared strings in the code maps. Returns None if
+    the code is unknown, or value unchanged if the property has no parser.
+    """
+    parser = PROPERTY_PARSER_MAP.get(prop)
+    if parser is None:
+        return value
+    return parser(value)
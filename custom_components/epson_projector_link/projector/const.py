@@ -19,9 +19,24 @@ def invert_map(map):
 
 TCP_PORT = 3629
 TIMEOUT_CONNECT = 10
+# Seconds to wait for each host, and maximum hosts probed at once
+TIMEOUT_DISCOVERY = 1
+DISCOVERY_MAX_CONCURRENCY = 64
+# Floor and ceiling of adaptive request timeouts. The floor is the 1 second
+# minimum of RFC 6298, since command classes mix fast and slow commands
+TIMEOUT_REQUEST_FLOOR = 1
 TIMEOUT_REQUEST = 10
 TIMEOUT_POWER_ON_OFF = 60
+MAX_QUEUE_DEPTH = 32
+# Seconds to wait for queued requests when stopping
+TIMEOUT_DRAIN = 5
+# Consecutive failures before requests fail fast, and seconds between probes
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_PROBE_INTERVAL = 5
+BREAKER_PROBE_INTERVAL_MAX = 60
 RESPONSE_ERROR = "ERR"
+# Longest response kept, longer data is discarded up to the next ":"
+MAX_FRAME_LENGTH = 1024
 
 ESCVPNETNAME = "ESC/VP.net"
 # 10 bytes | protocol | "ESC/VP.net"
@@ -58,11 +73,15 @@ PROPERTY_SOURCE = "SOURCE"
 PROPERTY_SOURCE_LIST = "SOURCELIST"
 PROPERTY_SERIAL_NUMBER = "SNO"
 PROPERTY_VOLUME = "VOL"
+# Pseudo property of whether the projector is reachable, never sent to it
+PROPERTY_AVAILABLE = "AVAILABLE"
 
 #
 # Commands
 #
 COMMAND_LOAD_LENS_MEMORY = "POPLP"
+# Seconds lens shift, zoom and focus may keep moving after loading a lens memory
+LENS_MEMORY_SETTLE_TIME = 10
 COMMAND_LOAD_PICTURE_MEMORY = "POPMEM"
 
 COMMAND_MEDIA_PLAY = "KEY D1"
@@ -77,6 +96,23 @@ COMMAND_MEDIA_VOL_DOWN = "KEY 57"
 ON = "ON"
 OFF = "OFF"
 
+#
+# Coalescing
+#
+# Minimum seconds between presses of the same key
+KEY_REPEAT_INTERVAL = 0.25
+# Maximum presses of the same key waiting to be sent, extra presses are dropped
+KEY_MAX_PENDING = 4
+# Key stream rates in commands per second
+KEY_STREAM_DEFAULT_RATE = 4
+KEY_STREAM_MAX_RATE = 20
+# Maximum streamed key commands queued or waiting for a response
+KEY_STREAM_MAX_IN_FLIGHT = 2
+# Seconds after which a key stream stops, in case it is never stopped
+KEY_STREAM_MAX_DURATION = 30
+# Volume is set in the range 0 to VOLUME_MAX
+VOLUME_MAX = 100
+
 #
 # Auto Iris
 #
@@ -222,3 +258,8 @@ IMEVENT_ALARM_BIT_MAP = {
     5: "High temperature",
     6: "Interior (system)",
 }
+# Events passed to event callbacks on warning and alarm transitions
+IMEVENT_ALARM_CLEARED = "alarm_cleared"
+IMEVENT_ALARM_RAISED = "alarm_raised"
+IMEVENT_WARNING_CLEARED = "warning_cleared"
+IMEVENT_WARNING_RAISED = "warning_raised"
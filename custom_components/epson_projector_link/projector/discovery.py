@@ -0,0 +1,100 @@
+"""LAN discovery of Epson projectors."""
+
+import asyncio
+from collections import namedtuple
+import ipaddress
+import logging
+
+import async_timeout
+
+from .codec import encode_command
+from .const import DISCOVERY_MAX_CONCURRENCY
+from .const import ESCVPNETNAME
+from .const import ESCVPNET_CONNECT_COMMAND
+from .const import PROPERTY_SERIAL_NUMBER
+from .const import STATUS_OK
+from .const import TCP_PORT
+from .const import TIMEOUT_DISCOVERY
+
+_LOGGER = logging.getLogger(__name__)
+
+DiscoveredProjector = namedtuple("DiscoveredProjector", ["host", "serial_number"])
+
+
+async def async_probe(host, port=TCP_PORT, timeout=TIMEOUT_DISCOVERY):
+    """
+    Probe a host for an ESC/VP.net projector.
+
+    :return DiscoveredProjector:    Projector, or None if the host didn't
+                                    complete the handshake in time
+    """
+    writer = None
+    try:
+        async with async_timeout.timeout(timeout):
+            reader, writer = await asyncio.open_connection(host=host, port=port)
+            writer.write(ESCVPNET_CONNECT_COMMAND.encode())
+            response = await reader.readexactly(16)
+            if response[0:10] != ESCVPNETNAME.encode() or response[14] != STATUS_OK:
+                _LOGGER.debug(
+                    "async_probe: host=%s unsupported response=%s", host, response
+                )
+                return None
+
+            writer.write(encode_command(f"{PROPERTY_SERIAL_NUMBER}?"))
+            response = (await reader.readuntil(b":")).decode()
+    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as err:
+        _LOGGER.debug("async_probe: host=%s not a projector: %r", host, err)
+        return None
+    finally:
+        if writer is not None:
+            writer.close()
+
+    # Response is "SNO=<serial>\r:", or "ERR\r:" if unsupported
+    prefix = f"{PROPERTY_SERIAL_NUMBER}="
+    response = response.rstrip(":").rstrip("\r")
+    serial_number = response[len(prefix) :] if response.startswith(prefix) else None
+    return DiscoveredProjector(host, serial_number)
+
+
+async def async_discover(
+    network,
+    port=TCP_PORT,
+    timeout=TIMEOUT_DISCOVERY,
+    max_concurrency=DISCOVERY_MAX_CONCURRENCY,
+    exclude_hosts=(),
+    exclude_serial_numbers=(),
+):
+    """
+    Scan a network for ESC/VP.net projectors concurrently.
+
+    :param str network:                     Network to scan, e.g. "192.168.1.0/24"
+    :param float timeout:                   Seconds to wait for each host
+    :param int max_concurrency:             Maximum number of probes in flight
+    :param exclude_hosts:                   Hosts not to probe, e.g. configured ones
+    :param exclude_serial_numbers:          Serial numbers to leave out of the result
+    :return list[DiscoveredProjector]:      Discovered projectors sorted by address
+    """
+    exclude_hosts = set(exclude_hosts)
+    exclude_serial_numbers = set(exclude_serial_numbers)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def probe(host):
+        async with semaphore:
+            return await async_probe(host, port, timeout)
+
+    hosts = [
+        str(address)
+        for address in ipaddress.ip_network(network, strict=False).hosts()
+        if str(address) not in exclude_hosts
+    ]
+    _LOGGER.debug("async_discover: Probing %d hosts in %s", len(hosts), network)
+    results = await asyncio.gather(*(probe(host) for host in hosts))
+    return [
+        projector
+        for projector in results
+        if projector is not None
+        and (
+            projector.serial_number is None
+            or projector.serial_number not in exclude_serial_numbers
+        )
+    ]
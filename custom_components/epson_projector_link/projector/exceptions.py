@@ -1,2 +1,22 @@
 class ProjectorErrorResponse(Exception):
     """Error to indicate projector returned error response."""
+
+
+class ProjectorInvalidResponse(Exception):
+    """Error to indicate projector returned a response that couldn't be parsed."""
+
+
+class ProjectorUnavailable(Exception):
+    """Error to indicate request was not sent since projector is unreachable."""
+
+
+class ProjectorQueueFull(Exception):
+    """Error to indicate request was not sent since too many are queued."""
+
+
+class ProjectorRequestExpired(Exception):
+    """Error to indicate request was not sent since its deadline passed."""
+
+
+class ProjectorSequenceAborted(Exception):
+    """Error to indicate request was not sent since a previous step failed."""
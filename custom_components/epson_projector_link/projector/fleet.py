@@ -0,0 +1,139 @@
+"""Concurrent dispatch of requests across multiple Epson projectors."""
+
+import asyncio
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _error_message(err):
+    message = str(err)
+    return message if message else type(err).__name__
+
+
+async def run_bulk(calls, max_concurrency, timeout):
+    """
+    Run calls concurrently with a concurrency cap and an overall deadline.
+
+    :param dict calls:          Map of key to coroutine function taking no arguments
+    :param int max_concurrency: Maximum number of calls in flight at once
+    :param float timeout:       Overall deadline in seconds for all calls
+    :return dict:               Map of key to dict with success, error, latency and result
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results = {
+        key: {
+            "success": False,
+            "error": "Deadline exceeded before start",
+            "latency": None,
+            "result": None,
+        }
+        for key in calls
+    }
+
+    async def run(key, call):
+        async with semaphore:
+            result = results[key]
+            start = time.monotonic()
+            try:
+                result["result"] = await call()
+                result["success"] = True
+                result["error"] = None
+            except asyncio.CancelledError:
+                result["error"] = "Deadline exceeded"
+                raise
+            except Exception as err:
+                _LOGGER.debug("run_bulk: key=%s error=%s", key, err)
+                result["error"] = _error_message(err)
+            finally:
+                result["latency"] = round(time.monotonic() - start, 3)
+
+    tasks = [asyncio.create_task(run(key, call)) for key, call in calls.items()]
+    if not tasks:
+        return results
+
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+    if pending:
+        _LOGGER.warning(
+            "run_bulk: Deadline of %ss exceeded with %d calls pending",
+            timeout,
+            len(pending),
+        )
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return results
+
+
+async def run_synchronized(projectors, command, timeout):
+    """
+    Send command to projectors so the writes are released together.
+
+    Each projector first connects and drains its request queue. Once every
+    projector is ready, or timeout elapses, the writes are released at a
+    barrier in the same event loop iteration.
+
+    :param dict projectors: Map of key to Projector
+    :param str command:     Command to send
+    :param float timeout:   Deadline in seconds for preparing and for sending
+    :return dict:           Dict with skew in milliseconds and a map of key to dict
+                            with success, error and offset in milliseconds
+    """
+    loop = asyncio.get_running_loop()
+    barrier = loop.create_future()
+    readies = {key: loop.create_future() for key in projectors}
+    tasks = {
+        key: asyncio.create_task(
+            projector.send_synchronized_command(command, readies[key], barrier)
+        )
+        for key, projector in projectors.items()
+    }
+    results = {
+        key: {"success": False, "error": None, "offset": None} for key in projectors
+    }
+    if not tasks:
+        return {"skew": None, "results": results}
+
+    async def prepare(key):
+        await asyncio.wait(
+            {readies[key], tasks[key]}, return_when=asyncio.FIRST_COMPLETED
+        )
+
+    await asyncio.wait(
+        [asyncio.create_task(prepare(key)) for key in tasks], timeout=timeout
+    )
+    for key, task in tasks.items():
+        if not readies[key].done():
+            _LOGGER.warning("run_synchronized: key=%s not ready before barrier", key)
+            task.cancel()
+    barrier.set_result(None)
+
+    _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    sent_times = {}
+    for key, task in tasks.items():
+        result = results[key]
+        if task.cancelled():
+            result["error"] = (
+                "Deadline exceeded"
+                if readies[key].done()
+                else "Not ready before barrier"
+            )
+        elif task.exception() is not None:
+            result["error"] = _error_message(task.exception())
+        else:
+            result["success"] = True
+            sent_times[key] = task.result()
+
+    skew = None
+    if sent_times:
+        first_sent_time = min(sent_times.values())
+        for key, sent_time in sent_times.items():
+            results[key]["offset"] = round((sent_time - first_sent_time) * 1000, 3)
+        skew = round((max(sent_times.values()) - first_sent_time) * 1000, 3)
+    _LOGGER.debug("run_synchronized: command=%s skew=%sms", command, skew)
+    return {"skew": skew, "results": results}
@@ -0,0 +1,89 @@
+"""Response framing of Epson projector module."""
+
+import binascii
+from collections import namedtuple
+import logging
+import re
+
+from .const import MAX_FRAME_LENGTH
+from .const import RESPONSE_ERROR
+
+_LOGGER = logging.getLogger(__name__)
+
+FRAME_END = b":"
+# Property responses and IMEVENT are "<KEY>=<value>", without control characters
+_PROPERTY_RESPONSE_RE = re.compile(r"[A-Z0-9]+=[^\x00-\x1f\x7f]*")
+
+InvalidFrame = namedtuple("InvalidFrame", ["data"])
+
+
+def _is_valid_response(response):
+    return (
+        response == ""
+        or response == RESPONSE_ERROR
+        or _PROPERTY_RESPONSE_RE.fullmatch(response) is not None
+    )
+
+
+class FrameParser:
+    """
+    Splits received bytes into responses, resynchronizing on invalid data.
+
+    Responses end with ":", e.g. ":" for an ACK and "PWR=01\r:" for a property.
+    Data that isn't a valid response, or runs longer than max_frame_length
+    without a ":", is discarded up to the next ":", so the responses after it
+    parse again without reconnecting.
+    """
+
+    def __init__(self, max_frame_length=MAX_FRAME_LENGTH):
+        self._max_frame_length = max_frame_length
+        self._buffer = bytearray()
+        # Whether the buffer is the rest of an over-long frame being discarded
+        self._discarding = False
+
+    def feed(self, data):
+        """
+        Add received bytes and split off the complete frames.
+
+        :return list:   Each frame's response without the trailing "\\r:", or an
+                        InvalidFrame with the start of each run of discarded data
+        """
+        self._buffer += data
+        frames = []
+        while True:
+            end = self._buffer.find(FRAME_END)
+            if end == -1:
+                if len(self._buffer) > self._max_frame_length:
+                    if not self._discarding:
+                        frames.append(self._invalid_frame(self._buffer))
+                        self._discarding = True
+                    self._buffer.clear()
+                return frames
+
+            frame = bytes(self._buffer[:end])
+            del self._buffer[: end + 1]
+            if self._discarding:
+                self._discarding = False
+                continue
+            if len(frame) > self._max_frame_length:
+                frames.append(self._invalid_frame(frame))
+                continue
+
+            try:
+                response = frame.decode()
+            except UnicodeDecodeError:
+                response = None
+            if response is not None and response.endswith("\r"):
+                response = response[:-1]
+            if response is None or not _is_valid_response(response):
+                frames.append(self._invalid_frame(frame))
+                continue
+            frames.append(response)
+
+    def _invalid_frame(self, data):
+        data = bytes(data[:64])
+        _LOGGER.debug(
+            "FrameParser: Discarding invalid data starting bytes=%s",
+            binascii.hexlify(data),
+        )
+        return InvalidFrame(data)
@@ -0,0 +1,202 @@
+"""Event history and statistics of Epson projector module."""
+
+from collections import deque
+import math
+import time
+
+from .const import STATE_COOLDOWN
+from .const import STATE_WARMUP
+
+DEFAULT_MAX_EVENTS = 100
+# Upper bounds in seconds of the power transition duration histogram buckets
+TRANSITION_DURATION_BUCKETS = (10, 20, 30, 45, 60, 90, 120, math.inf)
+
+EVENT_ALARM = "alarm"
+EVENT_ERROR_RESPONSE = "error_response"
+EVENT_POWER = "power"
+EVENT_RESYNC = "resync"
+EVENT_WARNING = "warning"
+
+
+class RunningStats:
+    """Count, mean, min, max and standard deviation updated in O(1)."""
+
+    __slots__ = ("count", "mean", "min", "max", "_m2", "buckets")
+
+    def __init__(self, buckets=TRANSITION_DURATION_BUCKETS):
+        self.count = 0
+        self.mean = 0.0
+        self.min = None
+        self.max = None
+        self._m2 = 0.0
+        self.buckets = {bound: 0 for bound in buckets}
+
+    def add(self, value):
+        # Welford's online algorithm
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        for bound in self.buckets:
+            if value <= bound:
+                self.buckets[bound] += 1
+                break
+
+    @property
+    def stddev(self):
+        return math.sqrt(self._m2 / self.count) if self.count > 1 else 0.0
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 3),
+            "min": self.min,
+            "max": self.max,
+            "stddev": round(self.stddev, 3),
+            "buckets": {
+                f"<={bound}" if bound != math.inf else "inf": count
+                for bound, count in self.buckets.items()
+            },
+        }
+
+
+class EventHistory:
+    """
+    Fixed size history of projector events with running aggregates.
+
+    Events are (timestamp, type, value) tuples kept in a ring buffer, so memory
+    stays bounded. Aggregates are updated as events are recorded, so reading
+    them is O(1) regardless of how many events were recorded.
+    """
+
+    def __init__(self, max_events=DEFAULT_MAX_EVENTS):
+        self._events = deque(maxlen=max_events)
+        self._power = None
+        self._power_since = None
+        self._time_in_power = {}
+        self._transition_durations = {
+            STATE_WARMUP: RunningStats(),
+            STATE_COOLDOWN: RunningStats(),
+        }
+        self._warnings = ()
+        self._warning_counts = {}
+        self._alarms = ()
+        self._alarm_counts = {}
+        self._error_response_count = 0
+        self._resync_count = 0
+        self._lamp_hours_first = None
+        self._lamp_hours_last = None
+
+    def _record(self, event_type, value):
+        self._events.append((time.time(), event_type, value))
+
+    def record_power(self, power):
+        if power == self._power:
+            return
+        now = time.monotonic()
+        if self._power is not None:
+            duration = now - self._power_since
+            self._time_in_power[self._power] = (
+                self._time_in_power.get(self._power, 0) + duration
+            )
+            transition_durations = self._transition_durations.get(self._power)
+            if transition_durations is not None:
+                transition_durations.add(round(duration, 3))
+        self._power = power
+        self._power_since = now
+        self._record(EVENT_POWER, power)
+
+    def record_warnings(self, warnings):
+        """Record the currently set warnings, counting newly raised ones."""
+        warnings = tuple(warnings)
+        if warnings == self._warnings:
+            return
+        for warning in warnings:
+            if warning not in self._warnings:
+                self._warning_counts[warning] = self._warning_counts.get(warning, 0) + 1
+        self._warnings = warnings
+        self._record(EVENT_WARNING, warnings)
+
+    def record_alarms(self, alarms):
+        """Record the currently set alarms, counting newly raised ones."""
+        alarms = tuple(alarms)
+        if alarms == self._alarms:
+            return
+        for alarm in alarms:
+            if alarm not in self._alarms:
+                self._alarm_counts[alarm] = self._alarm_counts.get(alarm, 0) + 1
+        self._alarms = alarms
+        self._record(EVENT_ALARM, alarms)
+
+    def record_error_response(self, command):
+        self._error_response_count += 1
+        self._record(EVENT_ERROR_RESPONSE, command)
+
+    def record_resync(self, command):
+        """Record invalid response data, and the command it failed if any."""
+        self._resync_count += 1
+        self._record(EVENT_RESYNC, command)
+
+    def record_lamp_hours(self, lamp_hours):
+        if not isinstance(lamp_hours, int):
+            return
+        sample = (time.monotonic(), lamp_hours)
+        if self._lamp_hours_first is None:
+            self._lamp_hours_first = sample
+        self._lamp_hours_last = sample
+
+    @property
+    def events(self):
+        return list(self._events)
+
+    def transition_durations(self, power):
+        """Running stats of warmup or cooldown durations, or None."""
+        return self._transition_durations.get(power)
+
+    @property
+    def lamp_hours_per_day(self):
+        """Lamp hours used per day since the first lamp hours sample, or None."""
+        if self._lamp_hours_first is None:
+            return None
+        first_time, first_hours = self._lamp_hours_first
+        last_time, last_hours = self._lamp_hours_last
+        if last_time <= first_time:
+            return None
+        return (last_hours - first_hours) / (last_time - first_time) * 86400
+
+    def time_in_power(self):
+        """Seconds spent in each power state, including the current one."""
+        time_in_power = dict(self._time_in_power)
+        if self._power is not None:
+            time_in_power[self._power] = time_in_power.get(self._power, 0) + (
+                time.monotonic() - self._power_since
+            )
+        return {power: round(seconds, 3) for power, seconds in time_in_power.items()}
+
+    def as_dict(self):
+        lamp_hours_per_day = self.lamp_hours_per_day
+        return {
+            "power": self._power,
+            "time_in_power": self.time_in_power(),
+            "warmup_duration": self._transition_durations[STATE_WARMUP].as_dict(),
+            "cooldown_duration": self._transition_durations[STATE_COOLDOWN].as_dict(),
+            "warnings": list(self._warnings),
+            "warning_counts": dict(self._warning_counts),
+            "alarms": list(self._alarms),
+            "alarm_counts": dict(self._alarm_counts),
+            "error_response_count": self._error_response_count,
+            "resync_count": self._resync_count,
+            "lamp_hours_per_day": (
+                None if lamp_hours_per_day is None else round(lamp_hours_per_day, 3)
+            ),
+            "events": [
+                {
+                    "time": timestamp,
+                    "type": event_type,
+                    "value": list(value) if isinstance(value, tuple) else value,
+                }
+                for timestamp, event_type, value in self._events
+            ],
+        }
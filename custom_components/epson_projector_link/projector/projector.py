@@ -5,37 +5,41 @@ import binascii
 from collections import deque
 import inspect
 import logging
+import time
 
 import async_timeout
 from homeassistant.const import STATE_UNKNOWN
 
-from .const import AUTO_IRIS_MODE_CODE_MAP
-from .const import COLOR_MODE_CODE_MAP
+from .breaker import CircuitBreaker
+from .codec import PROPERTY_PARSER_MAP
+from .codec import decode_alarms
+from .codec import decode_property
+from .codec import decode_warnings
+from .codec import encode_command
+from .codec import hex_string_to_int
+from .const import BREAKER_FAILURE_THRESHOLD
+from .const import BREAKER_PROBE_INTERVAL
+from .const import BREAKER_PROBE_INTERVAL_MAX
+from .const import COMMAND_LOAD_LENS_MEMORY
 from .const import ESCVPNETNAME
 from .const import ESCVPNET_CONNECT_COMMAND
 from .const import IMEVENT
-from .const import IMEVENT_ALARM_BIT_MAP
+from .const import IMEVENT_ALARM_CLEARED
+from .const import IMEVENT_ALARM_RAISED
 from .const import IMEVENT_STATUS_CODE_ABNORMAL
 from .const import IMEVENT_STATUS_CODE_TO_POWER_MAP
-from .const import IMEVENT_WARNING_BIT_MAP
+from .const import IMEVENT_WARNING_CLEARED
+from .const import IMEVENT_WARNING_RAISED
+from .const import LENS_MEMORY_SETTLE_TIME
+from .const import MAX_FRAME_LENGTH
+from .const import MAX_QUEUE_DEPTH
 from .const import OFF
 from .const import ON
-from .const import POWER_CODE_MAP
-from .const import POWER_CONSUMPTION_MODE_CODE_MAP
-from .const import PROPERTY_AUTO_IRIS_MODE
-from .const import PROPERTY_BRIGHTNESS
-from .const import PROPERTY_COLOR_MODE
+from .const import PROPERTY_AVAILABLE
 from .const import PROPERTY_ERR
-from .const import PROPERTY_ERR_CODE_MAP
 from .const import PROPERTY_LAMP_HOURS
-from .const import PROPERTY_MUTE
 from .const import PROPERTY_POWER
-from .const import PROPERTY_POWER_CONSUMPTION_MODE
-from .const import PROPERTY_SOURCE
-from .const import PROPERTY_SOURCE_LIST
-from .const import PROPERTY_VOLUME
 from .const import RESPONSE_ERROR
-from .const import SOURCE_CODE_MAP
 from .const import STATE_COOLDOWN
 from .const import STATE_OFF
 from .const import STATE_ON
@@ -44,51 +48,61 @@ from .const import STATUS_CODE_MAP
 from .const import STATUS_OK
 from .const import TCP_PORT
 from .const import TIMEOUT_CONNECT
+from .const import TIMEOUT_DRAIN
 from .const import TIMEOUT_POWER_ON_OFF
 from .const import TIMEOUT_REQUEST
+from .const import TIMEOUT_REQUEST_FLOOR
 from .exceptions import ProjectorErrorResponse
+from .exceptions import ProjectorInvalidResponse
+from .exceptions import ProjectorQueueFull
+from .exceptions import ProjectorRequestExpired
+from .exceptions import ProjectorSequenceAborted
+from .exceptions import ProjectorUnavailable
+from .framing import FrameParser
+from .framing import InvalidFrame
+from .history import EventHistory
+from .rtt import RttEstimator
+from .rtt import get_transition_timeout
+from .state import ProjectorState
+from .tracing import EVENT_COALESCED
+from .tracing import EVENT_CONNECTED
+from .tracing import EVENT_ENQUEUED
+from .tracing import EVENT_FOLDED
+from .tracing import EVENT_HANDSHAKE
+from .tracing import EVENT_RESPONSE
+from .tracing import EVENT_RESYNC
+from .tracing import EVENT_TIMEOUT
+from .tracing import EVENT_WAITING_POWER
+from .tracing import EVENT_WAITING_PREVIOUS
+from .tracing import EVENT_WRITTEN
+from .tracing import NOOP_SPAN
+from .tracing import SPAN_CONNECT
+from .tracing import SPAN_REQUEST
+from .tracing import Tracer
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def hex_string_to_int(string):
-    return int(string, 16)
+def _try_decode_property(prop, value):
+    try:
+        return decode_property(prop, value)
+    except Exception as err:
+        _LOGGER.debug(
+            '_try_decode_property: Unable to parse prop=%s value="%s": %s',
+            prop,
+            value,
+            err,
+        )
+        return None
 
 
-def _get_source_name(code):
-    source_name = SOURCE_CODE_MAP.get(code)
-    return code if source_name is None else source_name
+def _get_command_prop(command):
+    return command.partition(" ")[0].rstrip("?")
 
 
-def _parse_source_list(response):
-    parts = response.split(" ")
-    if len(parts) % 2 == 1:
-        _LOGGER.error(
-            "_parse_source_list: Source list response has odd number of values. response=%s",
-            response,
-        )
-    sources = []
-    for i in range(len(parts) // 2):
-        code = parts[2 * i]
-        source_name = SOURCE_CODE_MAP.get(code)
-        sources.append(code if source_name is None else source_name)
-    return sources
-
-
-POWER_PARSER = POWER_CODE_MAP.get
-PROPERTY_PARSER_MAP = {
-    PROPERTY_AUTO_IRIS_MODE: AUTO_IRIS_MODE_CODE_MAP.get,
-    PROPERTY_COLOR_MODE: COLOR_MODE_CODE_MAP.get,
-    PROPERTY_ERR: PROPERTY_ERR_CODE_MAP.get,
-    PROPERTY_LAMP_HOURS: int,
-    PROPERTY_BRIGHTNESS: int,
-    PROPERTY_MUTE: lambda v: v == ON,
-    PROPERTY_POWER: POWER_PARSER,
-    PROPERTY_POWER_CONSUMPTION_MODE: POWER_CONSUMPTION_MODE_CODE_MAP.get,
-    PROPERTY_SOURCE: _get_source_name,
-    PROPERTY_SOURCE_LIST: _parse_source_list,
-    PROPERTY_VOLUME: int,
-}
+def _is_success(request):
+    future = request.future
+    return future.done() and not future.cancelled() and future.exception() is None
 
 
 class Projector:
@@ -96,30 +110,234 @@ class Projector:
     Epson Projector Home Cinema that connects using a TCP socket.
     """
 
-    def __init__(self, host, port=TCP_PORT):
+    def __init__(
+        self,
+        host,
+        port=TCP_PORT,
+        timeout_floor=TIMEOUT_REQUEST_FLOOR,
+        timeout_ceiling=TIMEOUT_REQUEST,
+        max_queue_depth=MAX_QUEUE_DEPTH,
+        tracer=None,
+    ):
         """
-        :param str host:            IP address of Projector
-        :param int port:            Port to connect to
+        :param str host:                IP address of Projector
+        :param int port:                Port to connect to
+        :param float timeout_floor:     Minimum request timeout in seconds
+        :param float timeout_ceiling:   Maximum request timeout in seconds
+        :param int max_queue_depth:     Maximum number of queued requests
+        :param Tracer tracer:           Tracer of connect and request spans
         """
         self._host = host
         self._port = port
         self._is_open = False
+        self._is_stopped = False
         self._has_errors = False
         self._serial = None
-        self._callback = None
-        self._power_state = None
+        self._callbacks = []
+        self._event_callbacks = []
+        self._latency_callbacks = []
+        # Last IMEVENT and the warnings and alarms it had set
+        self._imevent = None
+        self._warnings = ()
+        self._alarms = ()
+        self._state = ProjectorState()
+        self._history = EventHistory()
+        self._rtt = RttEstimator(timeout_floor, timeout_ceiling)
+        self._breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD)
+        self._probe_task = None
+        self._property_set_times = {}
+        self._lens_memory_time = None
         self._power_on_off_future = None
         self._request_queue = deque()
+        self._max_queue_depth = max_queue_depth
         self._tasks = set()
+        self._connect_lock = asyncio.Lock()
+        self._tracer = tracer or Tracer()
+        self._has_connected = False
 
         self._reader = None
         self._writer = None
 
-    def set_callback(self, callback):
-        self._callback = callback
+    @property
+    def state(self):
+        """Latest known property values as a ProjectorState."""
+        return self._state
+
+    @property
+    def history(self):
+        """Bounded event history and statistics as an EventHistory."""
+        return self._history
+
+    @property
+    def rtt(self):
+        """Round trip time estimates per command class as an RttEstimator."""
+        return self._rtt
+
+    @property
+    def breaker(self):
+        """Reachability of the projector as a CircuitBreaker."""
+        return self._breaker
+
+    def add_callback(self, callback):
+        """
+        Add callback called with (prop, value) on property updates.
+
+        :return function:   Function that removes the callback
+        """
+        self._callbacks.append(callback)
+        return lambda: self._callbacks.remove(callback)
+
+    def add_event_callback(self, callback):
+        """
+        Add callback called with (event, data) on warning and alarm transitions.
+
+        Events are the IMEVENT_* constants, e.g. IMEVENT_WARNING_RAISED with
+        data {"warning": name}. Alarm events have data {"alarm": name}.
+
+        :return function:   Function that removes the callback
+        """
+        self._event_callbacks.append(callback)
+        return lambda: self._event_callbacks.remove(callback)
+
+    def add_latency_callback(self, callback):
+        """
+        Add callback called with (command, latency) on each response.
+
+        Latency is the seconds from writing the request to its response.
+
+        :return function:   Function that removes the callback
+        """
+        self._latency_callbacks.append(callback)
+        return lambda: self._latency_callbacks.remove(callback)
 
     async def connect(self):
-        """Async init to open connection with projector."""
+        """
+        Async init to open connection with projector.
+
+        Raises ProjectorUnavailable without trying while the projector has
+        been unreachable, until a background probe reaches it again.
+        """
+        self._check_breaker()
+        # Concurrent requests share one connection attempt
+        async with self._connect_lock:
+            self._check_breaker()
+            if not self._is_open:
+                try:
+                    await self._connect()
+                except Exception:
+                    self._record_failure()
+                    raise
+
+    async def _reconnect(self):
+        # Nothing awaits this task, so failures are logged instead of raised.
+        # A failure is recorded on the breaker, whose probe keeps retrying.
+        try:
+            await self.connect()
+        except Exception as err:
+            _LOGGER.debug("_reconnect: Unable to reconnect: %s", err)
+
+    async def async_start(self):
+        """Open the connection. Requests also open it on demand."""
+        self._is_stopped = False
+        await self.connect()
+
+    async def async_stop(self, drain_timeout=TIMEOUT_DRAIN):
+        """
+        Stop the projector, waiting up to drain_timeout for queued requests.
+
+        New requests are rejected with ProjectorUnavailable. Requests still
+        queued after drain_timeout are cancelled, every owned task is cancelled
+        and awaited, and the connection is closed.
+        """
+        _LOGGER.debug("async_stop: Stopping projector %s", self._host)
+        self._is_stopped = True
+        pending = [r.future for r in self._request_queue if not r.future.done()]
+        if pending:
+            await asyncio.wait(pending, timeout=drain_timeout)
+
+        writer = self._writer
+        self.close()
+        tasks = [task for task in self._tasks if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if writer is not None:
+            try:
+                await writer.wait_closed()
+            except Exception as err:
+                _LOGGER.debug("async_stop: Error closing connection: %s", err)
+        _LOGGER.debug("async_stop: Stopped projector %s", self._host)
+
+    async def __aenter__(self):
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.async_stop()
+
+    def _check_breaker(self):
+        if self._is_stopped:
+            raise ProjectorUnavailable(
+                f"Projector {self._host} is stopped, not sending request"
+            )
+        if not self._breaker.is_closed:
+            raise ProjectorUnavailable(
+                f"Projector {self._host} is unreachable, not sending request"
+            )
+
+    def _record_failure(self):
+        if not self._breaker.record_failure():
+            return
+        _LOGGER.warning(
+            "_record_failure: Projector %s is unreachable, failing requests until a probe reaches it",
+            self._host,
+        )
+        self._update_property(PROPERTY_AVAILABLE, False)
+        if self._is_stopped:
+            return
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = asyncio.create_task(self._probe())
+            self._tasks.add(self._probe_task)
+            self._probe_task.add_done_callback(self._tasks.discard)
+
+    def _record_success(self):
+        if self._breaker.record_success():
+            _LOGGER.info("_record_success: Projector %s is reachable", self._host)
+            self._update_property(PROPERTY_AVAILABLE, True)
+
+    async def _probe(self):
+        # Only the probe connects while the breaker is open
+        interval = BREAKER_PROBE_INTERVAL
+        while True:
+            await asyncio.sleep(interval)
+            self._breaker.half_open()
+            _LOGGER.debug("_probe: Probing projector %s", self._host)
+            try:
+                async with self._connect_lock:
+                    if not self._is_open:
+                        await self._connect()
+            except Exception as err:
+                _LOGGER.debug("_probe: Projector still unreachable: %s", err)
+                self._breaker.record_failure()
+                interval = min(interval * 2, BREAKER_PROBE_INTERVAL_MAX)
+                continue
+            self._record_success()
+            return
+
+    async def _connect(self):
+        span = self._tracer.start_span(
+            SPAN_CONNECT, host=self._host, reconnect=self._has_connected
+        )
+        try:
+            await self._open_connection(span)
+        except BaseException as err:
+            span.set_attribute("error", type(err).__name__)
+            raise
+        finally:
+            span.end()
+        self._has_connected = True
+
+    async def _open_connection(self, span):
         _LOGGER.debug("connect")
         response = None
         try:
@@ -127,8 +345,12 @@ class Projector:
                 reader, writer = await asyncio.open_connection(
                     host=self._host, port=self._port
                 )
+                span.add_event(EVENT_CONNECTED)
+                sent_time = time.perf_counter()
                 writer.write(ESCVPNET_CONNECT_COMMAND.encode())
                 response = await reader.read(16)
+                handshake_rtt = time.perf_counter() - sent_time
+                span.add_event(EVENT_HANDSHAKE)
         except asyncio.TimeoutError:
             _LOGGER.exception("connect: Opening connection timed out")
             raise
@@ -161,73 +383,294 @@ class Projector:
             raise Exception(f"Connect response returned error status={status}")
 
         self._is_open = True
+        # Commands not sent yet start from the round trip time of the handshake
+        self._rtt.seed(handshake_rtt)
+        # Status may have changed while disconnected, so process the next IMEVENT
+        self._imevent = None
         self._reader = reader
         self._writer = writer
-        self._create_task(self._listen())
+        self._create_task(self._listen(reader))
         _LOGGER.info("connect: Connection opened")
         return
 
     def close(self):
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
         if self._is_open:
             # Must set _is_open to false before closing to prevent re-connect try in _listen()
             self._is_open = False
             self._writer.close()
 
-            for request in self._request_queue:
-                request.future.cancel("Connection closed")
-            self._request_queue.clear()
+        for request in self._request_queue:
+            request.future.cancel("Connection closed")
+        self._request_queue.clear()
+
+    async def get_property(self, prop, background=False, deadline=None):
+        """
+        Get property state from device.
 
-    async def get_property(self, prop):
-        """Get property state from device."""
+        :param str prop:            Property to get
+        :param bool background:    Whether this is a background poll, which is
+                                    dropped first when the queue is full
+        :param float deadline:      Seconds after which the request is dropped
+                                    with ProjectorRequestExpired if not sent yet
+        """
         if not prop:
             return
-        return await self._send_request(Request(f"{prop}?"))
+        return await self._send_request(
+            Request(f"{prop}?", query=prop, background=background, deadline=deadline)
+        )
+
+    async def set_property(self, prop, value, optimistic=False):
+        """
+        Set property. Returns the set prop value.
 
-    async def set_property(self, prop, value):
-        """Set property. Returns the set prop value."""
+        The property is updated once the projector ACKs. If optimistic, it is
+        updated before sending instead, and rolled back if the request fails.
+        """
         if not prop or not value:
             return
-        return await self._send_request(Request(f"{prop} {value}", value))
+        request = Request(f"{prop} {value}", value, prop=prop)
+        if not optimistic or prop == PROPERTY_POWER:
+            return await self._send_request(request)
+
+        previous_value = self._state.get(prop)
+        optimistic_value = _try_decode_property(prop, value)
+        if optimistic_value is not None:
+            self._update_property(prop, optimistic_value)
+        try:
+            return await self._send_request(request)
+        except Exception:
+            if (
+                optimistic_value is not None
+                and self._state.get(prop) == optimistic_value
+            ):
+                _LOGGER.debug(
+                    "set_property: Rolling back prop=%s to value=%s",
+                    prop,
+                    previous_value,
+                )
+                self._update_property(prop, previous_value)
+            raise
+
+    def seconds_since_set(self, prop):
+        """Seconds since a set of prop was ACKed, or None if never set."""
+        set_time = self._property_set_times.get(prop)
+        return None if set_time is None else time.monotonic() - set_time
 
-    async def send_command(self, command, arg=None):
-        """Send command."""
+    async def send_command(self, command, arg=None, coalesce=True):
+        """
+        Send command.
+
+        :param bool coalesce:   Whether to share the response of the same command
+                                if it is already queued, instead of sending it again
+        """
         if not command:
             return
         if arg is not None:
             command = f"{command} {arg}"
-        return await self._send_request(Request(command))
+        request = Request(command)
+        request.can_coalesce = coalesce
+        return await self._send_request(request)
+
+    def lens_settle_time_left(self):
+        """Seconds the lens may still be moving after loading a lens memory."""
+        if self._lens_memory_time is None:
+            return 0
+        return max(
+            0, self._lens_memory_time + LENS_MEMORY_SETTLE_TIME - time.monotonic()
+        )
+
+    async def send_synchronized_command(self, command, ready, barrier):
+        """
+        Send command as soon as barrier resolves.
+
+        :param str command:             Command to send
+        :param asyncio.Future ready:    Resolved once all previous requests finished
+                                        and command is next to be written
+        :param asyncio.Future barrier:  Future to wait on before writing command
+        :return float:                  time.perf_counter() when command was written
+        """
+        request = Request(command, barrier=barrier, ready=ready)
+        await self._send_request(request)
+        return request.sent_time
+
+    async def run_sequence(self, steps):
+        """
+        Send steps back-to-back through the request queue, stopping on the first error.
+
+        :param list steps:  List of (command, new_property_value) tuples
+        :return list:       List of dicts with command, success, error, result, wait
+                            and latency in seconds for each step
+        """
+        if not steps:
+            return []
+        await self.connect()
+
+        start_time = time.perf_counter()
+        requests = []
+        previous = None
+        for command, new_property_value in steps:
+            previous = Request(
+                command,
+                new_property_value,
+                previous=previous,
+                # Sets write through and record their set time, like set_property
+                prop=None if new_property_value is None else _get_command_prop(command),
+            )
+            # Every step must be sent, even if the same command is already queued
+            previous.can_coalesce = False
+            requests.append(previous)
+
+        async def send(request):
+            try:
+                return await self._send_request(request)
+            finally:
+                request.done_time = time.perf_counter()
+
+        # Create all tasks at once so the steps are queued consecutively
+        tasks = [asyncio.create_task(send(request)) for request in requests]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = []
+        for request, task in zip(requests, tasks):
+            if request.future.done() and not request.future.cancelled():
+                # Mark exception as retrieved, since aborted futures may not be awaited
+                request.future.exception()
+            result = {
+                "command": request.command,
+                "success": False,
+                "error": None,
+                "result": None,
+                "wait": None,
+                "latency": None,
+            }
+            if request.sent_time is not None:
+                result["wait"] = round(request.sent_time - start_time, 3)
+                result["latency"] = round(request.done_time - request.sent_time, 3)
+            if task.cancelled():
+                # Cancelled when the connection was closed or dropped
+                result["error"] = "Cancelled"
+            elif task.exception() is None:
+                result["success"] = True
+                result["result"] = task.result()
+            else:
+                result["error"] = (
+                    str(task.exception()) or type(task.exception()).__name__
+                )
+            results.append(result)
+        return results
 
     async def _send_request(self, request):
         """Send TCP request."""
+        request.span = self._tracer.start_span(SPAN_REQUEST, command=request.command)
+        try:
+            return await self._queue_and_send_request(request)
+        except BaseException as err:
+            request.span.set_attribute("error", type(err).__name__)
+            raise
+        finally:
+            request.span.end()
+
+    async def _queue_and_send_request(self, request):
         _LOGGER.debug('_send_request: command="%s"', request.command)
 
+        self._check_breaker()
         if self._is_open is False:
             await self.connect()
 
-        for r in self._request_queue:
-            if r.command == request.command:
-                _LOGGER.debug(
-                    '_send_request: command="%s" waiting on previous duplicate command',
-                    request.command,
-                )
-                return await r.future
-
-        self._request_queue.append(request)
-
-        if len(self._request_queue) > 1:
+        r = self._find_coalesce_target(request)
+        if r is not None and r.command == request.command:
+            _LOGGER.debug(
+                '_send_request: command="%s" waiting on previous duplicate command',
+                request.command,
+            )
+            r.merge(request)
+            request.span.add_event(EVENT_COALESCED, onto=r.command)
+            return await self._await_request(r)
+        if r is not None and request.prop is not None:
+            # Last write wins, the pending set sends this value instead
+            _LOGGER.debug(
+                '_send_request: command="%s" replacing pending command="%s"',
+                request.command,
+                r.command,
+            )
+            r.span.add_event(EVENT_FOLDED, command=request.command)
+            request.span.add_event(EVENT_COALESCED, onto=r.command)
+            r.command = request.command
+            r.new_property_value = request.new_property_value
+            r.merge(request)
+            return await self._await_request(r)
+        if r is not None:
+            # Read after write, answered by the pending set once it is ACKed
             _LOGGER.debug(
-                '_send_request: command="%s" waiting for %d queued futures',
+                '_send_request: command="%s" answered by pending command="%s"',
                 request.command,
-                len(self._request_queue) - 1,
+                r.command,
             )
-            # Wait for previous request to finish, ignoring result
+            request.span.add_event(EVENT_COALESCED, onto=r.command)
             try:
-                await self._request_queue[-2].future
+                value = _try_decode_property(
+                    request.query, await self._await_request(r)
+                )
             except Exception:
-                pass
+                # Set failed, so the property has to be queried
+                value = None
+            if value is not None:
+                return value
+
+        self._enqueue(request)
+        request.span.add_event(EVENT_ENQUEUED, depth=len(self._request_queue))
+        # Sent from its own task, so a cancelled caller doesn't cancel the
+        # request for other callers sharing it
+        request.task = self._create_task(self._drive_request(request))
+        return await self._await_request(request)
+
+    async def _await_request(self, request):
+        """Wait for the response of a queued request, which callers may share."""
+        request.waiters += 1
+        try:
+            return await asyncio.shield(request.future)
+        finally:
+            request.waiters -= 1
+            if (
+                request.waiters == 0
+                and request.sent_time is None
+                and not request.future.done()
+            ):
+                # No caller wants the response anymore, so don't send it
+                _LOGGER.debug(
+                    '_await_request: command="%s" cancelled before sending',
+                    request.command,
+                )
+                request.task.cancel()
+                self._fail_request(request, None)
+
+    async def _drive_request(self, request):
+        try:
+            await self._send_queued_request(request)
+        except asyncio.CancelledError:
+            if request.sent_time is None:
+                self._fail_request(request, None)
+            raise
+        except Exception as err:
+            # The error is raised to the callers through the future
+            if not request.future.done():
+                request.future.set_exception(err)
+        finally:
+            # A request that was sent stays queued for its response
+            if request in self._request_queue and request.future.done():
+                self._request_queue.remove(request)
+
+    async def _send_queued_request(self, request):
+        await self._wait_for_turn(request)
+        if request.future.done():
+            # Shed while waiting
+            return
 
         # Wait if the projector is cooling down or warming up
-        if self._power_state == STATE_COOLDOWN or self._power_state == STATE_WARMUP:
+        if self._state.power == STATE_COOLDOWN or self._state.power == STATE_WARMUP:
             if (
                 self._power_on_off_future is not None
                 and not self._power_on_off_future.done()
@@ -237,7 +680,10 @@ class Projector:
                         '_send_request: command="%s" waiting for power state change future',
                         request.command,
                     )
-                    with async_timeout.timeout(TIMEOUT_POWER_ON_OFF):
+                    request.span.add_event(EVENT_WAITING_POWER, power=self._state.power)
+                    with async_timeout.timeout(
+                        self._get_transition_timeout(self._state.power)
+                    ):
                         await self._power_on_off_future
                 except asyncio.TimeoutError as err:
                     _LOGGER.warning(
@@ -252,6 +698,40 @@ class Projector:
                 except Exception:
                     pass
 
+        if request.previous is not None and not _is_success(request.previous):
+            err = ProjectorSequenceAborted(
+                f'Not sending command="{request.command}" since previous command failed'
+            )
+            _LOGGER.debug("_send_request: %s", err)
+            self._fail_request(request, err)
+            raise err
+
+        if request.is_expired():
+            err = ProjectorRequestExpired(
+                f'Not sending command="{request.command}" since its deadline passed'
+            )
+            _LOGGER.debug("_send_request: %s", err)
+            self._fail_request(request, err)
+            raise err
+
+        # Connection may have been dropped while waiting
+        if self._is_open is False:
+            try:
+                await self.connect()
+            except Exception as err:
+                self._fail_request(request, err)
+                raise
+
+        payload = encode_command(request.command)
+        if request.barrier is not None:
+            _LOGGER.debug(
+                '_send_request: command="%s" waiting for barrier',
+                request.command,
+            )
+            if not request.ready.done():
+                request.ready.set_result(None)
+            await request.barrier
+
         try:
             is_power_request = request.command.startswith(PROPERTY_POWER + " ")
             if is_power_request:
@@ -260,11 +740,31 @@ class Projector:
                 '_send_request: command="%s" sending request',
                 request.command,
             )
-            with async_timeout.timeout(
-                TIMEOUT_POWER_ON_OFF if is_power_request else TIMEOUT_REQUEST
-            ):
-                self._writer.write(f"{request.command}\r".encode())
-                return await request.future
+            if is_power_request:
+                timeout = self._get_transition_timeout(
+                    STATE_WARMUP if request.command.endswith(ON) else STATE_COOLDOWN
+                )
+            else:
+                timeout = self._rtt.timeout(request.command)
+            with async_timeout.timeout(timeout):
+                request.sent_time = time.perf_counter()
+                self._writer.write(payload)
+                request.span.add_event(EVENT_WRITTEN, timeout=timeout)
+                # Shield so a timeout fails the future instead of cancelling it
+                await asyncio.shield(request.future)
+        except asyncio.TimeoutError as err:
+            _LOGGER.warning(
+                '_send_request: command="%s" timed out after %.3fs, reconnecting',
+                request.command,
+                timeout,
+            )
+            request.span.add_event(EVENT_TIMEOUT)
+            self._fail_request(request, err)
+            self._rtt.backoff(request.command)
+            self._record_failure()
+            # A late response would be matched to the next request, so drop it
+            self._drop_connection()
+            raise
         except Exception as err:
             _LOGGER.exception(
                 '_send_request: command="%s" error=%s',
@@ -274,66 +774,172 @@ class Projector:
             if not request.future.done():
                 request.future.set_exception(err)
             raise
-        finally:
-            if request in self._request_queue:
-                self._request_queue.remove(request)
 
-    async def _listen(self):
+    def _find_coalesce_target(self, request):
+        """
+        Find a pending request that answers request, or None.
+
+        That is a duplicate command, an unsent set of the same property for a
+        set, or a set of the queried property for a query. Only the latest
+        pending request of the property is considered, so results stay in order.
+        """
+        if not request.can_coalesce:
+            return None
+        prop = request.prop or request.query
+        if prop == PROPERTY_POWER:
+            # Power sets start a transition, so their ACK isn't the power state
+            prop = None
+        for r in reversed(self._request_queue):
+            if r.future.done():
+                continue
+            if r.command == request.command:
+                return r
+            if prop is None or _get_command_prop(r.command) != prop:
+                continue
+            if (
+                r.can_coalesce
+                and r.prop == prop
+                and (request.query is not None or r.sent_time is None)
+            ):
+                return r
+            # Some other request of the property must be answered first
+            return None
+        return None
+
+    def _enqueue(self, request):
+        if len(self._request_queue) >= self._max_queue_depth:
+            # Make room by shedding the oldest background request not yet sent
+            shed = None
+            if not request.background:
+                shed = next(
+                    (
+                        r
+                        for r in self._request_queue
+                        if r.background and r.sent_time is None
+                    ),
+                    None,
+                )
+            if shed is None:
+                raise ProjectorQueueFull(
+                    f'Not sending command="{request.command}" since'
+                    f" {len(self._request_queue)} requests are queued"
+                )
+            _LOGGER.debug(
+                '_enqueue: Shedding command="%s" for command="%s"',
+                shed.command,
+                request.command,
+            )
+            self._fail_request(
+                shed,
+                ProjectorQueueFull(
+                    f'Shed command="{shed.command}" since the queue is full'
+                ),
+            )
+        self._request_queue.append(request)
+
+    async def _wait_for_turn(self, request):
+        # Requests may leave the queue out of order when shed or expired, so
+        # wait on the nearest predecessor still pending instead of a fixed one
+        while True:
+            previous = None
+            for r in self._request_queue:
+                if r is request:
+                    break
+                if not r.future.done():
+                    previous = r
+            if previous is None or request.future.done():
+                return
+            _LOGGER.debug(
+                '_wait_for_turn: command="%s" waiting for command="%s"',
+                request.command,
+                previous.command,
+            )
+            request.span.add_event(EVENT_WAITING_PREVIOUS, previous=previous.command)
+            # Also wake when the request itself is shed or cancelled
+            await asyncio.wait(
+                (previous.future, request.future),
+                timeout=request.time_left(),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if request.is_expired():
+                return
+
+    def _fail_request(self, request, err):
+        """Remove request from the queue, failing it with err, or cancelling it if None."""
+        if request in self._request_queue:
+            self._request_queue.remove(request)
+        if request.future.done():
+            return
+        if err is None:
+            # Requests waiting on it for their turn must not wait forever
+            request.future.cancel()
+            return
+        request.future.set_exception(err)
+        # Mark retrieved, since the error is raised to the caller as well
+        request.future.exception()
+
+    def _get_transition_timeout(self, power):
+        return get_transition_timeout(
+            self._history.transition_durations(power),
+            TIMEOUT_REQUEST,
+            TIMEOUT_POWER_ON_OFF,
+        )
+
+    def _drop_connection(self):
+        # Close without cancelling queued requests, they reconnect before sending
+        if self._is_open:
+            self._is_open = False
+            self._writer.close()
+
+    async def _listen(self, reader):
         _LOGGER.debug("_listen: Listening to connection")
+        parser = FrameParser()
 
-        while self._is_open:
+        # Stop if the connection was dropped, even if a new one was opened
+        while self._is_open and self._reader is reader:
             try:
-                response_bytes = await self._reader.readuntil(b":")
+                data = await reader.read(MAX_FRAME_LENGTH)
             except Exception:
                 break
-            if len(response_bytes) == 0:
+            if len(data) == 0:
                 _LOGGER.info("_listen: End of file")
                 break
 
-            response = response_bytes.decode()
-            _LOGGER.debug(
-                "_listen: response=%s bytes=%s len=%d",
-                response.encode("unicode_escape"),
-                binascii.hexlify(response_bytes),
-                len(response),
-            )
-
-            # Always ends with colon, strip it off
-            # Also strip off trailing carriage return if it exists
-            if len(response) >= 2 and response[-2] == "\r":
-                response = response[0:-2]
-            else:
-                response = response[0:-1]
+            for response in parser.feed(data):
+                # A frame handler may have closed the connection
+                if not (self._is_open and self._reader is reader):
+                    break
+                if isinstance(response, InvalidFrame):
+                    self._handle_invalid_frame(response.data)
+                    continue
 
-            if len(response) == 0:
-                self._handle_ack()
-                continue
+                _LOGGER.debug(
+                    "_listen: response=%s",
+                    response.encode("unicode_escape"),
+                )
+                if len(response) == 0:
+                    self._handle_ack()
+                    continue
 
-            if response == RESPONSE_ERROR:
-                self._handle_err()
-                continue
+                if response == RESPONSE_ERROR:
+                    self._handle_err()
+                    continue
 
-            key_value_separator_index = response.find("=")
-            if key_value_separator_index != -1:
-                prop = response[0:key_value_separator_index]
-                value = response[key_value_separator_index + 1 :]
+                prop, _, value = response.partition("=")
                 if prop == IMEVENT:
                     await self._handle_imevent(value)
                     continue
 
                 # Response from projector
                 self._handle_property(prop, value)
-                continue
-
-            _LOGGER.warning("_listen: Unhandled response %s", response)
 
         _LOGGER.info("_listen: Connection ended")
 
         # Try to-reopen connection, if it was not an explicit close.
         # Explicit close will set _is_open to False.
-        if self._is_open:
+        if self._is_open and self._reader is reader:
             self._is_open = False
-            self._create_task(self.connect())
+            self._create_task(self._reconnect())
 
     def _handle_ack(self):
         request = self._pop_request()
@@ -341,34 +947,86 @@ class Projector:
         _LOGGER.debug('_handle_ack: Received ACK response for command="%s"', command)
         if request:
             # Set state to warmup / cooldown so we will delay requests until power state changes
-            if (self._power_state == STATE_OFF) and command == f"{PROPERTY_POWER} {ON}":
-                if self._power_on_off_future is None:
+            if (self._state.power == STATE_OFF) and command == f"{PROPERTY_POWER} {ON}":
+                if self._needs_power_on_off_future(request):
                     _LOGGER.debug(
                         "_update_property: Creating _power_on_off_future for warmup"
                     )
                     self._power_on_off_future = asyncio.Future()
                 self._update_property(PROPERTY_POWER, STATE_WARMUP)
-            elif self._power_state == STATE_ON and command == f"{PROPERTY_POWER} {OFF}":
-                if self._power_on_off_future is None:
+            elif self._state.power == STATE_ON and command == f"{PROPERTY_POWER} {OFF}":
+                if self._needs_power_on_off_future(request):
                     _LOGGER.debug(
                         "_update_property: Creating _power_on_off_future for cooldown"
                     )
                     self._power_on_off_future = asyncio.Future()
                 self._update_property(PROPERTY_POWER, STATE_COOLDOWN)
+            elif request.prop is not None and request.prop != PROPERTY_POWER:
+                self._handle_set_ack(request)
+            elif command.startswith(COMMAND_LOAD_LENS_MEMORY + " "):
+                self._lens_memory_time = time.monotonic()
 
             if not request.future.done():
                 request.future.set_result(request.new_property_value)
 
+    def _handle_set_ack(self, request):
+        # Write through the set value, since the projector has now applied it
+        self._property_set_times[request.prop] = time.monotonic()
+        value = _try_decode_property(request.prop, request.new_property_value)
+        if value is not None and value != self._state.get(request.prop):
+            self._update_property(request.prop, value)
+
+    def _needs_power_on_off_future(self, request):
+        # The power request future resolves on ACK, so it can't track the transition
+        return (
+            self._power_on_off_future is None
+            or self._power_on_off_future is request.future
+            or self._power_on_off_future.done()
+        )
+
+    def _handle_invalid_frame(self, data):
+        # Projectors only respond to requests, except for IMEVENT, so the
+        # data is most likely the garbled response of the request in flight
+        request = None
+        if not data.startswith(IMEVENT.encode()) and self._request_queue:
+            request = self._request_queue[0]
+            if request.sent_time is None:
+                request = None
+        command = request.command if request else None
+        _LOGGER.warning(
+            '_handle_invalid_frame: Resynchronized after invalid response bytes=%s for command="%s"',
+            binascii.hexlify(data),
+            command or STATE_UNKNOWN,
+        )
+        self._history.record_resync(command)
+        if request:
+            self._request_queue.popleft()
+            request.span.add_event(EVENT_RESYNC)
+            if not request.future.done():
+                request.future.set_exception(
+                    ProjectorInvalidResponse(
+                        f'Received invalid response for command="{command}"'
+                    )
+                )
+            # The real response may still follow the garbage and would be
+            # matched to the next request, so drop it like a timeout does
+            self._drop_connection()
+
     def _handle_err(self):
         request = self._pop_request()
         command = request.command if request else STATE_UNKNOWN
         error_message = f'Received error response for command="{command}"'
         _LOGGER.warning("_handle_err: %s", error_message)
+        self._history.record_error_response(command)
         if request and not request.future.done():
             request.future.set_exception(ProjectorErrorResponse(error_message))
 
     async def _handle_imevent(self, value):
-        # Event from projector
+        # Event from projector, which is re-sent while the status is unchanged
+        if value == self._imevent:
+            _LOGGER.debug('_handle_imevent: unchanged imevent value="%s"', value)
+            return
+        self._imevent = value
         parts = value.split(" ")
         _LOGGER.debug('_handle_imevent: imevent value="%s"', value)
 
@@ -376,10 +1034,7 @@ class Projector:
             _LOGGER.warning("_handle_imevent: Value unexpectedly only has 2 parts.")
 
         if len(parts) >= 3:
-            warning_bitmask = hex_string_to_int(parts[2])
-            for bit, warning in IMEVENT_WARNING_BIT_MAP.items():
-                if (warning_bitmask & (1 << bit)) > 0:
-                    _LOGGER.warning('_handle_imevent: imevent warning="%s"', warning)
+            self._update_warnings(decode_warnings(hex_string_to_int(parts[2])))
 
         power_code = hex_string_to_int(parts[1])
         if power_code == IMEVENT_STATUS_CODE_ABNORMAL:
@@ -388,16 +1043,14 @@ class Projector:
                     "_handle_imevent: Value unexpectedly has less than 4 parts."
                 )
                 return
+            errors = decode_alarms(hex_string_to_int(parts[3]))
+            if errors == self._alarms:
+                return
             _LOGGER.error(
                 "_handle_imevent: imevent abnormal power code. Alarm Bitmask=%s",
                 parts[3],
             )
-            alarm_bitmask = hex_string_to_int(parts[3])
-            errors = []
-            for bit, alarm in IMEVENT_ALARM_BIT_MAP.items():
-                if (alarm_bitmask & (1 << bit)) > 0:
-                    _LOGGER.error('_handle_imevent: imevent alarm="%s"', alarm)
-                    errors.append(alarm)
+            self._update_alarms(errors)
             if len(errors) > 0:
                 self._has_errors = True
                 self._update_property(PROPERTY_ERR, ", ".join(errors))
@@ -408,7 +1061,38 @@ class Projector:
                     '_handle_imevent: unsupported power_code="%s"', power_code
                 )
             else:
-                self._update_property(PROPERTY_POWER, power)
+                self._update_alarms(())
+                # Errors are cleared by a power update, even if power is unchanged
+                if power != self._state.power or self._has_errors:
+                    self._update_property(PROPERTY_POWER, power)
+
+    def _update_warnings(self, warnings):
+        for warning in warnings:
+            if warning not in self._warnings:
+                _LOGGER.warning('_handle_imevent: imevent warning="%s"', warning)
+                self._fire_event(IMEVENT_WARNING_RAISED, warning=warning)
+        for warning in self._warnings:
+            if warning not in warnings:
+                _LOGGER.info('_handle_imevent: imevent warning="%s" cleared', warning)
+                self._fire_event(IMEVENT_WARNING_CLEARED, warning=warning)
+        self._warnings = warnings
+        self._history.record_warnings(warnings)
+
+    def _update_alarms(self, alarms):
+        for alarm in alarms:
+            if alarm not in self._alarms:
+                _LOGGER.error('_handle_imevent: imevent alarm="%s"', alarm)
+                self._fire_event(IMEVENT_ALARM_RAISED, alarm=alarm)
+        for alarm in self._alarms:
+            if alarm not in alarms:
+                _LOGGER.info('_handle_imevent: imevent alarm="%s" cleared', alarm)
+                self._fire_event(IMEVENT_ALARM_CLEARED, alarm=alarm)
+        self._alarms = alarms
+        self._history.record_alarms(alarms)
+
+    def _fire_event(self, event, **data):
+        for callback in self._event_callbacks:
+            self._create_task(self._create_callback_task(callback, event, data))
 
     def _handle_property(self, prop, value):
         _LOGGER.debug('_handle_property: prop=%s value="%s"', prop, value)
@@ -443,12 +1127,13 @@ class Projector:
         if prop == PROPERTY_POWER:
             # Sometimes power response for cooldown / warmup is a little late.
             # Ignore if the value is already on/off
-            if (self._power_state == STATE_OFF and value == STATE_COOLDOWN) or (
-                self._power_state == STATE_ON and value == STATE_WARMUP
+            if (self._state.power == STATE_OFF and value == STATE_COOLDOWN) or (
+                self._state.power == STATE_ON and value == STATE_WARMUP
             ):
                 return
 
-            self._power_state = value
+            self._state.power = value
+            self._history.record_power(value)
             if value == STATE_OFF or value == STATE_ON:
                 if (
                     self._power_on_off_future is not None
@@ -460,8 +1145,12 @@ class Projector:
                 if self._has_errors:
                     self._has_errors = False
                     self._update_property(PROPERTY_ERR, None)
-        if self._callback:
-            self._create_task(self._create_callback_task(self._callback, prop, value))
+        else:
+            self._state.set(prop, value)
+            if prop == PROPERTY_LAMP_HOURS:
+                self._history.record_lamp_hours(value)
+        for callback in self._callbacks:
+            self._create_task(self._create_callback_task(callback, prop, value))
 
     # Callback may not be async, so should wrap it in async function
     async def _create_callback_task(self, callback, prop, value):
@@ -473,10 +1162,21 @@ class Projector:
         task = asyncio.create_task(coro)
         self._tasks.add(task)
         task.add_done_callback(self._tasks.discard)
+        return task
 
     def _pop_request(self):
         if len(self._request_queue) > 0:
-            return self._request_queue.popleft()
+            request = self._request_queue.popleft()
+            request.span.add_event(EVENT_RESPONSE)
+            self._record_success()
+            if request.sent_time is not None:
+                latency = time.perf_counter() - request.sent_time
+                self._rtt.add_sample(request.command, latency)
+                for callback in self._latency_callbacks:
+                    self._create_task(
+                        self._create_callback_task(callback, request.command, latency)
+                    )
+            return request
 
         _LOGGER.error("_pop_request: Request queue is unexpectedly empty")
         return None
@@ -487,7 +1187,81 @@ class Request:
     Request for projector
     """
 
-    def __init__(self, command, new_property_value=None):
+    __slots__ = (
+        "command",
+        "new_property_value",
+        "prop",
+        "query",
+        "barrier",
+        "ready",
+        "previous",
+        "background",
+        "deadline",
+        "span",
+        "can_coalesce",
+        "sent_time",
+        "done_time",
+        "task",
+        "waiters",
+        "_future",
+    )
+
+    def __init__(
+        self,
+        command,
+        new_property_value=None,
+        barrier=None,
+        ready=None,
+        previous=None,
+        prop=None,
+        query=None,
+        background=False,
+        deadline=None,
+    ):
         self.command = command
         self.new_property_value = new_property_value
-        self.future = asyncio.Future()
+        # Property being set, if this is a property set request
+        self.prop = prop
+        # Property being queried, if this is a property get request
+        self.query = query
+        # Optional future to wait on before writing, for synchronized sends
+        self.barrier = barrier
+        self.ready = ready
+        # Optional previous request in a sequence, which must succeed before sending
+        self.previous = previous
+        # Background polls are shed first when the queue is full
+        self.background = background
+        # time.monotonic() after which the request is dropped if not sent yet
+        self.deadline = None if deadline is None else time.monotonic() + deadline
+        # Synchronized requests must each be sent
+        self.can_coalesce = barrier is None
+        self.sent_time = None
+        self.done_time = None
+        # Tracing span, set once the request is sent through the queue
+        self.span = NOOP_SPAN
+        # Task sending the request once queued, and how many callers wait on it
+        self.task = None
+        self.waiters = 0
+        self._future = None
+
+    @property
+    def future(self):
+        # Created lazily, since requests coalesced onto a duplicate never need one
+        if self._future is None:
+            self._future = asyncio.get_running_loop().create_future()
+        return self._future
+
+    def merge(self, other):
+        """Merge a duplicate request into this one, keeping the more urgent."""
+        self.background = self.background and other.background
+        if self.deadline is not None:
+            self.deadline = (
+                None if other.deadline is None else max(self.deadline, other.deadline)
+            )
+
+    def time_left(self):
+        """Seconds until the deadline, or None if there is none."""
+        return None if self.deadline is None else self.deadline - time.monotonic()
+
+    def is_expired(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
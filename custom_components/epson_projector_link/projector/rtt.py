@@ -0,0 +1,122 @@
+"""Adaptive request timeouts of Epson projector module."""
+
+# Smoothing gains and variance multiplier from RFC 6298
+RTT_ALPHA = 1 / 8
+RTT_BETA = 1 / 4
+RTT_K = 4
+# Margin over the longest expected power transition
+TRANSITION_TIMEOUT_MARGIN = 1.5
+
+
+def get_command_class(command):
+    """
+    Get the class of a command that shares round trip times.
+
+    Queries and sets of a property are separate classes, since a set can take
+    much longer to be applied, e.g. switching source.
+    """
+    if command.endswith("?"):
+        return command
+    return command.split(" ", 1)[0]
+
+
+class RttStats:
+    """Smoothed round trip time and its variance for a command class."""
+
+    __slots__ = ("count", "srtt", "rttvar", "rto")
+
+    def __init__(self):
+        self.count = 0
+        self.srtt = None
+        self.rttvar = None
+        self.rto = None
+
+    def add(self, rtt):
+        self.count += 1
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - RTT_BETA) * self.rttvar + RTT_BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - RTT_ALPHA) * self.srtt + RTT_ALPHA * rtt
+        self.rto = self.srtt + RTT_K * self.rttvar
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "srtt": None if self.srtt is None else round(self.srtt, 4),
+            "rttvar": None if self.rttvar is None else round(self.rttvar, 4),
+            "rto": None if self.rto is None else round(self.rto, 4),
+        }
+
+
+class RttEstimator:
+    """
+    Request timeouts estimated from round trip times per command class.
+
+    Works like a TCP retransmission timeout: the timeout is the smoothed round
+    trip time plus a multiple of its variance, clamped to [floor, ceiling].
+    A timeout doubles the class timeout until the next sample. Classes without
+    samples start from the round trip time of the connection handshake, and
+    from the floor before it is known.
+    """
+
+    def __init__(self, floor, ceiling):
+        self._floor = floor
+        self._ceiling = ceiling
+        self._initial = RttStats()
+        self._stats = {}
+
+    def seed(self, rtt):
+        """Set the round trip time of the connection handshake."""
+        self._initial = RttStats()
+        self._initial.add(rtt)
+
+    def add_sample(self, command, rtt):
+        command_class = get_command_class(command)
+        stats = self._stats.get(command_class)
+        if stats is None:
+            stats = self._stats[command_class] = RttStats()
+        stats.add(rtt)
+
+    def backoff(self, command):
+        command_class = get_command_class(command)
+        stats = self._stats.get(command_class)
+        if stats is None:
+            # Back off from the initial timeout until the class has a sample
+            stats = self._stats[command_class] = RttStats()
+        stats.rto = min(self._ceiling, self.timeout(command) * 2)
+
+    def timeout(self, command):
+        stats = self._stats.get(get_command_class(command))
+        if stats is None or stats.rto is None:
+            stats = self._initial
+        if stats.rto is None:
+            return self._floor
+        return max(self._floor, min(self._ceiling, stats.rto))
+
+    def as_dict(self):
+        return {
+            "floor": self._floor,
+            "ceiling": self._ceiling,
+            "initial": self._initial.as_dict(),
+            "classes": {
+                command_class: stats.as_dict()
+                for command_class, stats in sorted(self._stats.items())
+            },
+        }
+
+
+def get_transition_timeout(stats, floor, ceiling):
+    """
+    Get the timeout of a power transition from its learned durations.
+
+    :param RunningStats stats:  Durations of previous transitions
+    :param float floor:         Minimum timeout, so a spuriously short
+                                transition doesn't time out the next one
+    :param float ceiling:       Timeout if there are no previous transitions
+    """
+    if stats is None or stats.count == 0:
+        return ceiling
+    expected = max(stats.max, stats.mean + RTT_K * stats.stddev)
+    return max(floor, min(ceiling, expected * TRANSITION_TIMEOUT_MARGIN))
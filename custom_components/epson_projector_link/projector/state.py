@@ -0,0 +1,62 @@
+"""State record of Epson projector module."""
+
+from .const import PROPERTY_AUTO_IRIS_MODE
+from .const import PROPERTY_AVAILABLE
+from .const import PROPERTY_BRIGHTNESS
+from .const import PROPERTY_COLOR_MODE
+from .const import PROPERTY_ERR
+from .const import PROPERTY_LAMP_HOURS
+from .const import PROPERTY_MUTE
+from .const import PROPERTY_POWER
+from .const import PROPERTY_POWER_CONSUMPTION_MODE
+from .const import PROPERTY_SERIAL_NUMBER
+from .const import PROPERTY_SOURCE
+from .const import PROPERTY_SOURCE_LIST
+from .const import PROPERTY_VOLUME
+
+PROPERTY_TO_STATE_FIELD_MAP = {
+    PROPERTY_AUTO_IRIS_MODE: "auto_iris_mode",
+    PROPERTY_AVAILABLE: "available",
+    PROPERTY_BRIGHTNESS: "brightness",
+    PROPERTY_COLOR_MODE: "color_mode",
+    PROPERTY_ERR: "error",
+    PROPERTY_LAMP_HOURS: "lamp_hours",
+    PROPERTY_MUTE: "mute",
+    PROPERTY_POWER: "power",
+    PROPERTY_POWER_CONSUMPTION_MODE: "power_consumption_mode",
+    PROPERTY_SERIAL_NUMBER: "serial_number",
+    PROPERTY_SOURCE: "source",
+    PROPERTY_SOURCE_LIST: "source_list",
+    PROPERTY_VOLUME: "volume",
+}
+
+
+class ProjectorState:
+    """
+    Latest known property values of a projector.
+
+    Code properties hold the shared decoded strings from the code maps in
+    const.py, e.g. STATE_ON or "HDMI1", so they can be compared by identity.
+    Values are None until known.
+    """
+
+    __slots__ = tuple(PROPERTY_TO_STATE_FIELD_MAP.values())
+
+    def __init__(self):
+        for field in self.__slots__:
+            setattr(self, field, None)
+
+    def get(self, prop):
+        field = PROPERTY_TO_STATE_FIELD_MAP.get(prop)
+        return None if field is None else getattr(self, field)
+
+    def set(self, prop, value):
+        """Set property value. Returns whether the value changed."""
+        field = PROPERTY_TO_STATE_FIELD_MAP.get(prop)
+        if field is None or getattr(self, field) == value:
+            return False
+        setattr(self, field, value)
+        return True
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
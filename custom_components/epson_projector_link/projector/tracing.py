@@ -0,0 +1,108 @@
+"""Request lifecycle tracing of Epson projector module."""
+
+from collections import deque
+import time
+
+SPAN_CONNECT = "connect"
+SPAN_REQUEST = "request"
+
+# Connect span events
+EVENT_CONNECTED = "connected"
+EVENT_HANDSHAKE = "handshake"
+# Request span events
+EVENT_COALESCED = "coalesced"
+EVENT_ENQUEUED = "enqueued"
+EVENT_FOLDED = "folded"
+EVENT_RESPONSE = "response"
+EVENT_RESYNC = "resync"
+EVENT_TIMEOUT = "timeout"
+EVENT_WAITING_POWER = "waiting_power"
+EVENT_WAITING_PREVIOUS = "waiting_previous"
+EVENT_WRITTEN = "written"
+
+DEFAULT_MAX_SPANS = 100
+
+
+class Tracer:
+    """
+    No-op tracer, the default of a Projector.
+
+    Override start_span to return objects with the Span methods to export
+    spans, e.g. as OpenTelemetry spans. Timestamps are time.monotonic().
+    """
+
+    def start_span(self, name, **attributes):
+        return NOOP_SPAN
+
+
+class Span:
+    """Span of a connect or request, with timestamped events."""
+
+    __slots__ = ("name", "attributes", "start_time", "end_time", "events", "_tracer")
+
+    def __init__(self, tracer, name, attributes):
+        self.name = name
+        self.attributes = attributes
+        self.start_time = time.monotonic()
+        self.end_time = None
+        self.events = []
+        self._tracer = tracer
+
+    def add_event(self, name, **attributes):
+        self.events.append((time.monotonic(), name, attributes))
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def end(self):
+        if self.end_time is None:
+            self.end_time = time.monotonic()
+            self._tracer.on_end(self)
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "attributes": self.attributes,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "events": [
+                {"time": timestamp, "name": name, "attributes": attributes}
+                for timestamp, name, attributes in self.events
+            ],
+        }
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def add_event(self, name, **attributes):
+        pass
+
+    def set_attribute(self, key, value):
+        pass
+
+    def end(self):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class InMemoryTracer(Tracer):
+    """Tracer that keeps the last max_spans ended spans, e.g. for tests."""
+
+    def __init__(self, max_spans=DEFAULT_MAX_SPANS):
+        self._spans = deque(maxlen=max_spans)
+
+    def start_span(self, name, **attributes):
+        return Span(self, name, attributes)
+
+    def on_end(self, span):
+        self._spans.append(span)
+
+    @property
+    def spans(self):
+        return list(self._spans)
+
+    def clear(self):
+        self._spans.clear()
@@ -0,0 +1,102 @@
+"""Selects for Epson projector properties."""
+
+import logging
+
+from homeassistant.components.select import SelectEntity
+from homeassistant.components.select import SelectEntityDescription
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.const import STATE_UNKNOWN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.restore_state import RestoreEntity
+
+from .const import PROPERTY_TO_ATTRIBUTE_NAME_MAP
+from .entity import EpsonProjectorPropertyEntity
+from .entity import async_setup_property_entities
+from .projector.const import AUTO_IRIS_MODE_CODE_INVERTED_MAP
+from .projector.const import COLOR_MODE_CODE_INVERTED_MAP
+from .projector.const import POWER_CONSUMPTION_MODE_CODE_INVERTED_MAP
+from .projector.const import PROPERTY_AUTO_IRIS_MODE
+from .projector.const import PROPERTY_COLOR_MODE
+from .projector.const import PROPERTY_POWER_CONSUMPTION_MODE
+from .projector.const import PROPERTY_SOURCE
+from .projector.const import PROPERTY_SOURCE_LIST
+from .projector.const import SOURCE_CODE_INVERTED_MAP
+
+_LOGGER = logging.getLogger(__name__)
+
+PROPERTY_TO_CODE_MAP = {
+    PROPERTY_AUTO_IRIS_MODE: AUTO_IRIS_MODE_CODE_INVERTED_MAP,
+    PROPERTY_COLOR_MODE: COLOR_MODE_CODE_INVERTED_MAP,
+    PROPERTY_POWER_CONSUMPTION_MODE: POWER_CONSUMPTION_MODE_CODE_INVERTED_MAP,
+    PROPERTY_SOURCE: SOURCE_CODE_INVERTED_MAP,
+}
+
+SELECT_DESCRIPTIONS = {
+    prop: SelectEntityDescription(
+        key=PROPERTY_TO_ATTRIBUTE_NAME_MAP[prop],
+        options=list(code_map.keys()),
+    )
+    for prop, code_map in PROPERTY_TO_CODE_MAP.items()
+}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities
+):
+    """Set up the Epson projector selects from a config entry."""
+    async_setup_property_entities(
+        hass,
+        config_entry,
+        async_add_entities,
+        EpsonProjectorSelect,
+        SELECT_DESCRIPTIONS,
+    )
+
+
+class EpsonProjectorSelect(EpsonProjectorPropertyEntity, SelectEntity, RestoreEntity):
+    """Select of a polled Epson projector property."""
+
+    def __init__(self, config_entry, projector, prop):
+        super().__init__(config_entry, projector, prop)
+        self.entity_description = SELECT_DESCRIPTIONS[prop]
+        self._attr_current_option = None
+        self._attr_options = list(self.entity_description.options)
+
+    async def _async_restore_value(self):
+        last_state = await self.async_get_last_state()
+        if last_state is None or last_state.state in (
+            STATE_UNAVAILABLE,
+            STATE_UNKNOWN,
+        ):
+            return
+        self._restore_value(last_state.state)
+
+    async def async_added_to_hass(self):
+        """Run when entity about to be added."""
+        await super().async_added_to_hass()
+        if self._prop == PROPERTY_SOURCE:
+            self._update_source_list(self._projector.state.source_list)
+
+    def _callback(self, prop, value):
+        if prop == PROPERTY_SOURCE_LIST and self._prop == PROPERTY_SOURCE:
+            self._update_source_list(value)
+            self.async_write_ha_state()
+            return
+        super()._callback(prop, value)
+
+    def _update_source_list(self, source_list):
+        if source_list:
+            self._attr_options = list(source_list)
+            self._update_value(self._attr_current_option)
+
+    def _update_value(self, value):
+        if value is not None and value not in self._attr_options:
+            # Projector may return codes not in the options, e.g. for sources
+            self._attr_options = self._attr_options + [value]
+        self._attr_current_option = value
+
+    async def async_select_option(self, option):
+        """Set the property on the projector."""
+        code = PROPERTY_TO_CODE_MAP[self._prop].get(option, option)
+        await self._async_set_property(self._prop, code)
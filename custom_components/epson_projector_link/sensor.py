@@ -0,0 +1,71 @@
+"""Sensors for Epson projector properties."""
+
+import logging
+
+from homeassistant.components.sensor import RestoreSensor
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.components.sensor import SensorEntityDescription
+from homeassistant.components.sensor import SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant
+
+from .const import PROPERTY_TO_ATTRIBUTE_NAME_MAP
+from .entity import EpsonProjectorPropertyEntity
+from .entity import async_setup_property_entities
+from .projector.const import PROPERTY_BRIGHTNESS
+from .projector.const import PROPERTY_ERR
+from .projector.const import PROPERTY_LAMP_HOURS
+from .projector.const import PROPERTY_VOLUME
+
+_LOGGER = logging.getLogger(__name__)
+
+SENSOR_DESCRIPTIONS = {
+    PROPERTY_BRIGHTNESS: SensorEntityDescription(
+        key=PROPERTY_TO_ATTRIBUTE_NAME_MAP[PROPERTY_BRIGHTNESS],
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    PROPERTY_ERR: SensorEntityDescription(
+        key=PROPERTY_TO_ATTRIBUTE_NAME_MAP[PROPERTY_ERR],
+    ),
+    PROPERTY_LAMP_HOURS: SensorEntityDescription(
+        key=PROPERTY_TO_ATTRIBUTE_NAME_MAP[PROPERTY_LAMP_HOURS],
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    PROPERTY_VOLUME: SensorEntityDescription(
+        key=PROPERTY_TO_ATTRIBUTE_NAME_MAP[PROPERTY_VOLUME],
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities
+):
+    """Set up the Epson projector sensors from a config entry."""
+    async_setup_property_entities(
+        hass,
+        config_entry,
+        async_add_entities,
+        EpsonProjectorSensor,
+        SENSOR_DESCRIPTIONS,
+    )
+
+
+class EpsonProjectorSensor(EpsonProjectorPropertyEntity, RestoreSensor):
+    """Sensor of a polled Epson projector property."""
+
+    def __init__(self, config_entry, projector, prop):
+        super().__init__(config_entry, projector, prop)
+        self.entity_description = SENSOR_DESCRIPTIONS[prop]
+
+    async def _async_restore_value(self):
+        last_sensor_data = await self.async_get_last_sensor_data()
+        if last_sensor_data is None:
+            return
+        self._restore_value(last_sensor_data.native_value)
+
+    def _update_value(self, value):
+        self._attr_native_value = value
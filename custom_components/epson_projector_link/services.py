@@ -0,0 +1,159 @@
+"""Domain services for the epson integration."""
+
+import logging
+
+from homeassistant.components.media_player import DOMAIN as MEDIA_PLAYER_DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.core import ServiceCall
+from homeassistant.core import SupportsResponse
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
+from homeassistant.helpers.service import async_extract_entity_ids
+import voluptuous as vol
+
+from .const import DEFAULT_BULK_MAX_CONCURRENCY
+from .const import DEFAULT_BULK_TIMEOUT
+from .const import DEFAULT_SYNCHRONIZED_TIMEOUT
+from .const import DOMAIN
+from .const import SERVICE_BULK_COMMAND
+from .const import SERVICE_SYNCHRONIZED_COMMAND
+from .projector.fleet import run_bulk
+from .projector.fleet import run_synchronized
+
+_LOGGER = logging.getLogger(__name__)
+
+BULK_COMMAND_SCHEMA = vol.All(
+    cv.make_entity_service_schema(
+        {
+            vol.Exclusive("command", "request"): cv.string,
+            vol.Exclusive("property", "request"): cv.string,
+            vol.Optional("value"): cv.string,
+            vol.Optional(
+                "max_concurrency", default=DEFAULT_BULK_MAX_CONCURRENCY
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=64)),
+            vol.Optional("timeout", default=DEFAULT_BULK_TIMEOUT): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=300)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key("command", "property"),
+)
+
+SYNCHRONIZED_COMMAND_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required("command"): cv.string,
+        vol.Optional("timeout", default=DEFAULT_SYNCHRONIZED_TIMEOUT): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=300)
+        ),
+    }
+)
+
+
+def async_setup_services(hass: HomeAssistant):
+    """Register domain services."""
+
+    async def async_bulk_command(call: ServiceCall):
+        return await _async_bulk_command(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_COMMAND,
+        async_bulk_command,
+        schema=BULK_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def async_synchronized_command(call: ServiceCall):
+        return await _async_synchronized_command(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SYNCHRONIZED_COMMAND,
+        async_synchronized_command,
+        schema=SYNCHRONIZED_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def _async_get_projectors(hass, call):
+    """
+    Map the targeted media player entity ids to their Projector, or None if
+    not loaded.
+
+    Device and area targets include each projector's sensors and selects too,
+    so only media players are kept, one per config entry.
+    """
+    registry = async_get_entity_registry(hass)
+    loaded = hass.data.get(DOMAIN, {})
+    projectors = {}
+    config_entry_ids = set()
+    for entity_id in sorted(await async_extract_entity_ids(hass, call)):
+        entry = registry.async_get(entity_id)
+        if (
+            entry is None
+            or entry.platform != DOMAIN
+            or entry.domain != MEDIA_PLAYER_DOMAIN
+            or entry.config_entry_id in config_entry_ids
+        ):
+            continue
+        config_entry_ids.add(entry.config_entry_id)
+        projectors[entity_id] = loaded.get(entry.config_entry_id)
+    return projectors
+
+
+def _create_call(projector, data):
+    command = data.get("command")
+    prop = data.get("property")
+    value = data.get("value")
+
+    async def call():
+        if projector is None:
+            raise Exception("Projector is not loaded")
+        if command is not None:
+            return await projector.send_command(command)
+        if value is None:
+            return await projector.get_property(prop)
+        return await projector.set_property(prop, value)
+
+    return call
+
+
+async def _async_bulk_command(hass, call):
+    projectors = await _async_get_projectors(hass, call)
+    _LOGGER.debug("_async_bulk_command: entity_ids=%s", list(projectors))
+    results = await run_bulk(
+        {
+            entity_id: _create_call(projector, call.data)
+            for entity_id, projector in projectors.items()
+        },
+        max_concurrency=call.data["max_concurrency"],
+        timeout=call.data["timeout"],
+    )
+    succeeded = sum(1 for result in results.values() if result["success"])
+    return {
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+    }
+
+
+async def _async_synchronized_command(hass, call):
+    projectors = await _async_get_projectors(hass, call)
+    _LOGGER.debug("_async_synchronized_command: entity_ids=%s", list(projectors))
+    response = await run_synchronized(
+        {
+            entity_id: projector
+            for entity_id, projector in projectors.items()
+            if projector is not None
+        },
+        call.data["command"],
+        timeout=call.data["timeout"],
+    )
+    for entity_id, projector in projectors.items():
+        if projector is None:
+            response["results"][entity_id] = {
+                "success": False,
+                "error": "Projector is not loaded",
+                "offset": None,
+            }
+    return response
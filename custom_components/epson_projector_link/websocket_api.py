@@ -0,0 +1,97 @@
+"""Websocket API for the epson integration."""
+
+import logging
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+
+from .const import DOMAIN
+from .const import WS_TYPE_SUBSCRIBE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant):
+    """Register websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_SUBSCRIBE,
+        vol.Optional("entry_ids"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+@callback
+def websocket_subscribe(hass, connection, msg):
+    """
+    Subscribe to live state of projectors, all loaded ones if no entry_ids.
+
+    Each projector sends a snapshot event first, then property, imevent and
+    latency events as they happen.
+    """
+    projectors = hass.data.get(DOMAIN, {})
+    entry_ids = msg.get("entry_ids", list(projectors))
+    unknown_entry_ids = [
+        entry_id for entry_id in entry_ids if entry_id not in projectors
+    ]
+    if unknown_entry_ids:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Projectors not loaded: {', '.join(unknown_entry_ids)}",
+        )
+        return
+
+    def send_event(entry_id, event_type, **data):
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {"entry_id": entry_id, "type": event_type, **data}
+            )
+        )
+
+    unsubs = []
+    for entry_id in entry_ids:
+        projector = projectors[entry_id]
+        unsubs.append(
+            projector.add_callback(
+                lambda prop, value, entry_id=entry_id: send_event(
+                    entry_id, "property", property=prop, value=value
+                )
+            )
+        )
+        unsubs.append(
+            projector.add_event_callback(
+                lambda event, data, entry_id=entry_id: send_event(
+                    entry_id, "imevent", event=event, **data
+                )
+            )
+        )
+        unsubs.append(
+            projector.add_latency_callback(
+                lambda command, latency, entry_id=entry_id: send_event(
+                    entry_id, "latency", command=command, latency=round(latency, 3)
+                )
+            )
+        )
+
+    @callback
+    def unsubscribe():
+        for unsub in unsubs:
+            unsub()
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_result(msg["id"])
+    for entry_id in entry_ids:
+        projector = projectors[entry_id]
+        send_event(
+            entry_id,
+            "snapshot",
+            state=projector.state.as_dict(),
+            rtt=projector.rtt.as_dict(),
+            breaker=projector.breaker.as_dict(),
+        )
@@ -0,0 +1,159 @@
+"""
+Benchmark of the projector codec against the inline code it replaced.
+
+Measures CPU time and bytes allocated per call of IMEVENT bitmask decoding and
+command encoding. The reference functions are the per-frame code that ran
+before projector/codec.py, so the two can be compared on the same machine.
+
+Run from the repository root, e.g.:
+
+    python -m scripts.codec_benchmark
+    python -m scripts.codec_benchmark --number 200000 --output codec.json
+"""
+
+import argparse
+import json
+import platform
+import timeit
+import tracemalloc
+
+from custom_components.epson_projector_link.projector.codec import decode_alarms
+from custom_components.epson_projector_link.projector.codec import decode_property
+from custom_components.epson_projector_link.projector.codec import decode_warnings
+from custom_components.epson_projector_link.projector.codec import encode_command
+from custom_components.epson_projector_link.projector.codec import hex_string_to_int
+from custom_components.epson_projector_link.projector.const import IMEVENT_ALARM_BIT_MAP
+from custom_components.epson_projector_link.projector.const import (
+    IMEVENT_WARNING_BIT_MAP,
+)
+from custom_components.epson_projector_link.projector.const import PROPERTY_POWER
+from custom_components.epson_projector_link.projector.const import PROPERTY_SOURCE
+
+from .load_test import get_commit
+
+# Lamp life and no signal warnings, lamp burnout alarm
+WARNING_BITMASK = "0003"
+ALARM_BITMASK = "0004"
+COMMAND = f"{PROPERTY_POWER}?"
+
+
+def reference_decode_warnings(bitmask):
+    return [
+        warning
+        for bit, warning in IMEVENT_WARNING_BIT_MAP.items()
+        if (bitmask & (1 << bit)) > 0
+    ]
+
+
+def reference_decode_alarms(bitmask):
+    return [
+        alarm
+        for bit, alarm in IMEVENT_ALARM_BIT_MAP.items()
+        if (bitmask & (1 << bit)) > 0
+    ]
+
+
+def reference_encode_command(command):
+    return f"{command}\r".encode()
+
+
+CASES = [
+    (
+        "decode_warnings",
+        lambda: reference_decode_warnings(hex_string_to_int(WARNING_BITMASK)),
+        lambda: decode_warnings(hex_string_to_int(WARNING_BITMASK)),
+    ),
+    (
+        "decode_alarms",
+        lambda: reference_decode_alarms(hex_string_to_int(ALARM_BITMASK)),
+        lambda: decode_alarms(hex_string_to_int(ALARM_BITMASK)),
+    ),
+    (
+        "encode_command",
+        lambda: reference_encode_command(COMMAND),
+        lambda: encode_command(COMMAND),
+    ),
+    (
+        "decode_property",
+        None,
+        lambda: decode_property(PROPERTY_SOURCE, "30"),
+    ),
+]
+
+
+def measure_time(func, number, repeat):
+    """Best microseconds per call over repeat runs of number calls."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def measure_allocations(func, number):
+    """Bytes allocated per call for results that are kept, e.g. in a history."""
+    results = [None] * number
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        for i in range(number):
+            results[i] = func()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (current - start) / number
+
+
+def run(args):
+    report = {
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "parameters": vars(args),
+        "cases": {},
+    }
+    for name, reference, func in CASES:
+        case = {}
+        for label, candidate in (("reference", reference), ("codec", func)):
+            if candidate is None:
+                continue
+            case[label] = {
+                "us_per_call": round(
+                    measure_time(candidate, args.number, args.repeat), 4
+                ),
+                "bytes_per_call": round(
+                    measure_allocations(candidate, args.number // 10), 1
+                ),
+            }
+        report["cases"][name] = case
+    return report
+
+
+def print_table(report):
+    print(
+        f"{'case':<18}{'ref us':>10}{'codec us':>10}{'ref bytes':>11}{'codec bytes':>13}"
+    )
+    for name, case in report["cases"].items():
+        reference = case.get("reference", {})
+        codec = case["codec"]
+        print(
+            f"{name:<18}{str(reference.get('us_per_call', '-')):>10}"
+            f"{codec['us_per_call']:>10}"
+            f"{str(reference.get('bytes_per_call', '-')):>11}"
+            f"{codec['bytes_per_call']:>13}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=100000, help="Calls per run")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case")
+    parser.add_argument("--output", help="File to write the JSON report to")
+    args = parser.parse_args()
+    output = args.output
+    del args.output
+
+    report = run(args)
+    print_table(report)
+    if output:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
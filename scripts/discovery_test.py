@@ -0,0 +1,124 @@
+"""
+Discovery check of the network scanner against simulated projectors.
+
+Starts simulated projectors on loopback addresses, plus a responder that
+answers the handshake with something other than ESC/VP.net, and scans the
+loopback network for them with async_discover. Checks that exactly the
+simulated projectors are found with their serial numbers, and that excluded
+hosts and serial numbers are left out. Exits with status 1 on a mismatch.
+
+Loopback addresses other than 127.0.0.1 are routed on Linux, but need to be
+added as aliases of lo0 on macOS.
+
+Run from the repository root, e.g.:
+
+    python -m scripts.discovery_test --projectors 5
+"""
+
+import argparse
+import asyncio
+import ipaddress
+import json
+import logging
+import sys
+import time
+
+from custom_components.epson_projector_link.projector.discovery import (
+    DiscoveredProjector,
+)
+from custom_components.epson_projector_link.projector.discovery import async_discover
+
+from .load_test import SimulatedProjector
+
+NETWORK = "127.0.0.0/24"
+# Answers the handshake like an unrelated service on the port
+NOT_A_PROJECTOR_RESPONSE = b"HTTP/1.1 400 \r\n"
+
+
+async def start_not_a_projector(host, port):
+    async def handle(reader, writer):
+        await reader.read(16)
+        writer.write(NOT_A_PROJECTOR_RESPONSE)
+        writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+async def scan(port, timeout, **kwargs):
+    start = time.monotonic()
+    found = await async_discover(NETWORK, port=port, timeout=timeout, **kwargs)
+    return found, round(time.monotonic() - start, 3)
+
+
+async def run(args):
+    # Skip 127.0.0.1, which other local services listen on
+    hosts = [str(host) for host in ipaddress.ip_network(NETWORK).hosts()][
+        1 : args.projectors + 2
+    ]
+    projector_hosts, other_host = hosts[:-1], hosts[-1]
+    simulators = [
+        SimulatedProjector(0, 0, 0, serial_number=f"SIM{i:04d}")
+        for i in range(len(projector_hosts))
+    ]
+    # The first simulator picks a free port, which the others bind on their host
+    await simulators[0].start(projector_hosts[0])
+    port = simulators[0].port
+    for simulator, host in zip(simulators[1:], projector_hosts[1:]):
+        await simulator.start(host, port)
+    other = await start_not_a_projector(other_host, port)
+
+    expected = [
+        DiscoveredProjector(host, f"SIM{i:04d}")
+        for i, host in enumerate(projector_hosts)
+    ]
+    checks = {}
+    try:
+        found, duration = await scan(port, args.timeout)
+        checks["all"] = {
+            "ok": found == expected,
+            "found": [list(projector) for projector in found],
+            "duration": duration,
+        }
+
+        found, duration = await scan(
+            port,
+            args.timeout,
+            exclude_hosts=[expected[0].host],
+            exclude_serial_numbers=[expected[-1].serial_number],
+        )
+        checks["excluded"] = {
+            "ok": found == expected[1:-1],
+            "found": [list(projector) for projector in found],
+            "duration": duration,
+        }
+    finally:
+        other.close()
+        await asyncio.gather(*(simulator.stop() for simulator in simulators))
+
+    return {
+        "network": NETWORK,
+        "port": port,
+        "parameters": vars(args),
+        "checks": checks,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--projectors", type=int, default=5)
+    parser.add_argument(
+        "--timeout", type=float, default=0.5, help="Seconds to wait for each host"
+    )
+    args = parser.parse_args()
+    if args.projectors < 2:
+        parser.error("--projectors must be at least 2")
+
+    logging.basicConfig(level=logging.CRITICAL)
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2))
+    if not all(check["ok"] for check in report["checks"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,422 @@
+"""
+Load test of many Epson projectors polled from one event loop.
+
+Starts simulated ESC/VP.net projectors in process, and polls each with a real
+Projector at the integration's poll intervals. Reports event loop lag,
+latency per command, task count, memory and CPU as JSON, so runs can be
+compared across commits.
+
+Run from the repository root, e.g.:
+
+    python -m scripts.load_test --projectors 500 --duration 120 --output a.json
+    python -m scripts.load_test --projectors 500 --compare a.json
+
+Each projector uses 3 file descriptors, so raise `ulimit -n` for large runs.
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+import json
+import logging
+import math
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+
+from custom_components.epson_projector_link.const import DEFAULT_POWER_SCAN_INTERVAL
+from custom_components.epson_projector_link.const import (
+    DEFAULT_PROPERTIES_SCAN_INTERVAL,
+)
+from custom_components.epson_projector_link.projector import Projector
+from custom_components.epson_projector_link.projector.const import ESCVPNETNAME
+from custom_components.epson_projector_link.projector.const import PROPERTY_BRIGHTNESS
+from custom_components.epson_projector_link.projector.const import PROPERTY_COLOR_MODE
+from custom_components.epson_projector_link.projector.const import PROPERTY_LAMP_HOURS
+from custom_components.epson_projector_link.projector.const import PROPERTY_POWER
+from custom_components.epson_projector_link.projector.const import (
+    PROPERTY_SERIAL_NUMBER,
+)
+from custom_components.epson_projector_link.projector.const import PROPERTY_SOURCE
+from custom_components.epson_projector_link.projector.const import PROPERTY_VOLUME
+from custom_components.epson_projector_link.projector.const import STATUS_OK
+from custom_components.epson_projector_link.projector.exceptions import (
+    ProjectorQueueFull,
+)
+from custom_components.epson_projector_link.projector.exceptions import (
+    ProjectorRequestExpired,
+)
+from custom_components.epson_projector_link.projector.rtt import get_command_class
+
+_LOGGER = logging.getLogger(__name__)
+
+# Version 0x10, type 0x03, status OK, no headers
+HANDSHAKE_RESPONSE = ESCVPNETNAME.encode() + bytes((0x10, 0x03, 0, 0, STATUS_OK, 0))
+# Property values the simulated projectors answer queries with
+PROPERTY_VALUES = {
+    PROPERTY_BRIGHTNESS: "128",
+    PROPERTY_COLOR_MODE: "06",
+    PROPERTY_LAMP_HOURS: "1234",
+    PROPERTY_POWER: "01",
+    PROPERTY_SOURCE: "30",
+    PROPERTY_VOLUME: "10",
+}
+POLL_PROPERTIES = [
+    PROPERTY_BRIGHTNESS,
+    PROPERTY_COLOR_MODE,
+    PROPERTY_LAMP_HOURS,
+    PROPERTY_SOURCE,
+    PROPERTY_VOLUME,
+]
+# IMEVENT with power on and no warnings, which projectors re-send periodically
+IMEVENT_STATUS = b"IMEVENT=0001 03 0000 0000 00\r:"
+LAG_INTERVAL = 0.1
+SAMPLE_INTERVAL = 1
+
+
+class SimulatedProjector:
+    """
+    ESC/VP.net endpoint answering with fixed property values.
+
+    Counts the commands it receives in command_counts. Commands in responses
+    are answered with those raw bytes instead, e.g. to send invalid data.
+    """
+
+    def __init__(self, latency, jitter, imevent_interval, serial_number="000000"):
+        self._latency = latency
+        self._jitter = jitter
+        self._imevent_interval = imevent_interval
+        self._values = {**PROPERTY_VALUES, PROPERTY_SERIAL_NUMBER: serial_number}
+        self._server = None
+        self._tasks = set()
+        self.port = None
+        self.connection_count = 0
+        self.command_counts = Counter()
+        self.responses = {}
+
+    @property
+    def sessions(self):
+        """Number of open control sessions."""
+        return len(self._tasks)
+
+    async def start(self, host="127.0.0.1", port=0):
+        self._server = await asyncio.start_server(self._handle, host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self._tasks.add(asyncio.current_task())
+        self.connection_count += 1
+        imevent_task = None
+        try:
+            await reader.readexactly(16)
+            writer.write(HANDSHAKE_RESPONSE)
+            if self._imevent_interval:
+                imevent_task = asyncio.create_task(self._push_imevents(writer))
+            while True:
+                command = (await reader.readuntil(b"\r"))[:-1].decode()
+                self.command_counts[command] += 1
+                await asyncio.sleep(self._latency + random.random() * self._jitter)
+                if command in self.responses:
+                    writer.write(self.responses[command])
+                elif command.endswith("?"):
+                    prop = command[:-1]
+                    writer.write(f"{prop}={self._values.get(prop, '00')}\r:".encode())
+                else:
+                    writer.write(b":")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if imevent_task is not None:
+                imevent_task.cancel()
+            writer.close()
+            self._tasks.discard(asyncio.current_task())
+
+    async def _push_imevents(self, writer):
+        # Spread pushes of different projectors over the interval
+        await asyncio.sleep(random.random() * self._imevent_interval)
+        while True:
+            writer.write(IMEVENT_STATUS)
+            await asyncio.sleep(self._imevent_interval)
+
+
+class Poller:
+    """Polls a projector like the media player, skipping ticks while busy."""
+
+    def __init__(self, projector, power_interval, properties_interval):
+        self._projector = projector
+        self._power_interval = power_interval
+        self._properties_interval = properties_interval
+        self.cycles = 0
+        self.skipped_ticks = 0
+        self.errors = {}
+
+    async def run(self):
+        # Stagger the first poll, like entities set up at different times
+        await asyncio.sleep(random.random() * self._properties_interval)
+        await asyncio.gather(
+            self._run_every(self._power_interval, self._poll_power),
+            self._run_every(self._properties_interval, self._poll_properties),
+        )
+
+    async def _run_every(self, interval, poll):
+        task = None
+        while True:
+            if task is None or task.done():
+                task = asyncio.create_task(poll())
+                task.add_done_callback(self._on_done)
+            else:
+                self.skipped_ticks += 1
+            await asyncio.sleep(interval)
+
+    def _on_done(self, task):
+        if task.cancelled():
+            return
+        self.cycles += 1
+        err = task.exception()
+        if err is not None:
+            name = type(err).__name__
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    async def _poll_power(self):
+        await self._projector.get_property(PROPERTY_POWER)
+
+    async def _poll_properties(self):
+        results = await asyncio.gather(
+            *(
+                self._projector.get_property(
+                    prop, background=True, deadline=self._properties_interval
+                )
+                for prop in POLL_PROPERTIES
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, (ProjectorQueueFull, ProjectorRequestExpired)):
+                name = type(result).__name__
+                self.errors[name] = self.errors.get(name, 0) + 1
+            elif isinstance(result, Exception):
+                raise result
+
+
+def percentiles(values):
+    if not values:
+        return None
+    values = sorted(values)
+
+    def percentile(p):
+        return values[min(len(values) - 1, math.ceil(p / 100 * len(values)) - 1)]
+
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 6),
+        "p50": round(percentile(50), 6),
+        "p95": round(percentile(95), 6),
+        "p99": round(percentile(99), 6),
+        "max": round(values[-1], 6),
+    }
+
+
+def get_rss_bytes():
+    """Current resident set size, or the peak if the platform has no /proc."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def get_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def measure_loop_lag(lags):
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(LAG_INTERVAL)
+        lags.append(loop.time() - start - LAG_INTERVAL)
+
+
+async def sample(samples):
+    while True:
+        samples.append((len(asyncio.all_tasks()), get_rss_bytes()))
+        await asyncio.sleep(SAMPLE_INTERVAL)
+
+
+async def run(args):
+    rss_start = get_rss_bytes()
+    simulators = [
+        SimulatedProjector(args.latency, args.jitter, args.imevent_interval)
+        for _ in range(args.projectors)
+    ]
+    await asyncio.gather(*(simulator.start() for simulator in simulators))
+
+    latencies = {}
+
+    def on_latency(command, latency):
+        latencies.setdefault(get_command_class(command), []).append(latency)
+
+    projectors = []
+    pollers = []
+    for simulator in simulators:
+        projector = Projector("127.0.0.1", simulator.port)
+        projector.add_latency_callback(on_latency)
+        projectors.append(projector)
+        pollers.append(Poller(projector, args.power_interval, args.properties_interval))
+
+    lags = []
+    samples = []
+    background_tasks = [
+        asyncio.create_task(measure_loop_lag(lags)),
+        asyncio.create_task(sample(samples)),
+    ]
+    cpu_start = time.process_time()
+    wall_start = time.monotonic()
+    poll_tasks = [asyncio.create_task(poller.run()) for poller in pollers]
+    await asyncio.sleep(args.duration)
+    wall = time.monotonic() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    for task in poll_tasks + background_tasks:
+        task.cancel()
+    await asyncio.gather(*poll_tasks, *background_tasks, return_exceptions=True)
+    await asyncio.gather(*(projector.async_stop() for projector in projectors))
+    await asyncio.gather(*(simulator.stop() for simulator in simulators))
+
+    errors = {}
+    for poller in pollers:
+        for name, count in poller.errors.items():
+            errors[name] = errors.get(name, 0) + count
+    rss_peak = max((rss for _, rss in samples), default=rss_start)
+    return {
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "parameters": vars(args),
+        "loop_lag": percentiles(lags),
+        "latency": {
+            command: percentiles(values)
+            for command, values in sorted(latencies.items())
+        },
+        "tasks": {
+            "max": max((tasks for tasks, _ in samples), default=0),
+            "per_projector": round(
+                max((tasks for tasks, _ in samples), default=0) / args.projectors, 2
+            ),
+        },
+        "memory": {
+            "rss_start": rss_start,
+            "rss_peak": rss_peak,
+            "per_projector": round((rss_peak - rss_start) / args.projectors),
+        },
+        "cpu": {
+            "utilization": round(cpu / wall, 4),
+            "seconds_per_projector": round(cpu / args.projectors, 6),
+        },
+        "polls": {
+            "cycles": sum(poller.cycles for poller in pollers),
+            "skipped_ticks": sum(poller.skipped_ticks for poller in pollers),
+            "errors": errors,
+        },
+    }
+
+
+def compare(report, baseline):
+    """Print metrics that differ between a baseline report and this one."""
+    rows = [
+        ("loop_lag.p99", ["loop_lag", "p99"]),
+        ("loop_lag.max", ["loop_lag", "max"]),
+        ("tasks.per_projector", ["tasks", "per_projector"]),
+        ("memory.per_projector", ["memory", "per_projector"]),
+        ("cpu.utilization", ["cpu", "utilization"]),
+        ("polls.skipped_ticks", ["polls", "skipped_ticks"]),
+    ]
+    for command in sorted(set(report["latency"]) | set(baseline["latency"])):
+        rows.append((f"latency.{command}.p95", ["latency", command, "p95"]))
+
+    def get(data, path):
+        for key in path:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(key)
+        return data
+
+    print(
+        f"{'metric':<32}{baseline['commit'] or 'baseline':>14}{report['commit'] or 'current':>14}{'change':>10}"
+    )
+    for name, path in rows:
+        old, new = get(baseline, path), get(report, path)
+        change = ""
+        if old and new is not None:
+            change = f"{(new - old) / old:+.1%}"
+        print(f"{name:<32}{str(old):>14}{str(new):>14}{change:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--projectors", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=120, help="Seconds")
+    parser.add_argument(
+        "--power-interval",
+        type=float,
+        default=DEFAULT_POWER_SCAN_INTERVAL,
+        help="Seconds between power polls",
+    )
+    parser.add_argument(
+        "--properties-interval",
+        type=float,
+        default=DEFAULT_PROPERTIES_SCAN_INTERVAL,
+        help="Seconds between property polls",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="Simulated response seconds"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.01, help="Random extra response seconds"
+    )
+    parser.add_argument(
+        "--imevent-interval",
+        type=float,
+        default=10,
+        help="Seconds between repeated IMEVENT pushes, 0 to disable",
+    )
+    parser.add_argument("--output", help="File to write the JSON report to")
+    parser.add_argument("--compare", help="Baseline JSON report to compare with")
+    args = parser.parse_args()
+    output, baseline = args.output, args.compare
+    del args.output, args.compare
+
+    logging.basicConfig(level=logging.ERROR)
+    report = asyncio.run(run(args))
+    if output:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if baseline:
+        with open(baseline) as file:
+            compare(report, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
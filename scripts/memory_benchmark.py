@@ -0,0 +1,127 @@
+"""
+Memory benchmark of queued requests and projector state.
+
+Measures bytes allocated per instance with tracemalloc. The reference classes
+are the request with an instance dict and an eager future, and the attribute
+dict of the latest values, that Request and ProjectorState replaced, so the
+two can be compared on the same machine.
+
+Run from the repository root, e.g.:
+
+    python -m scripts.memory_benchmark
+    python -m scripts.memory_benchmark --number 10000 --output memory.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import tracemalloc
+
+from custom_components.epson_projector_link.projector.const import PROPERTY_POWER
+from custom_components.epson_projector_link.projector.const import PROPERTY_SOURCE
+from custom_components.epson_projector_link.projector.projector import Request
+from custom_components.epson_projector_link.projector.state import (
+    PROPERTY_TO_STATE_FIELD_MAP,
+)
+from custom_components.epson_projector_link.projector.state import ProjectorState
+
+from .load_test import get_commit
+
+COMMAND = f"{PROPERTY_POWER}?"
+
+
+class ReferenceRequest:
+    def __init__(
+        self,
+        command,
+        new_property_value=None,
+        barrier=None,
+        ready=None,
+        previous=None,
+    ):
+        self.command = command
+        self.new_property_value = new_property_value
+        self.future = asyncio.Future()
+        self.barrier = barrier
+        self.ready = ready
+        self.previous = previous
+        self.can_coalesce = barrier is None
+        self.sent_time = None
+        self.done_time = None
+
+
+def create_request_with_future():
+    request = Request(COMMAND, query=PROPERTY_POWER)
+    request.future
+    return request
+
+
+def create_state():
+    state = ProjectorState()
+    state.set(PROPERTY_POWER, "on")
+    state.set(PROPERTY_SOURCE, "HDMI1")
+    return state
+
+
+def create_reference_state():
+    state = {field: None for field in PROPERTY_TO_STATE_FIELD_MAP.values()}
+    state["power"] = "on"
+    state["source"] = "HDMI1"
+    return state
+
+
+CASES = [
+    ("reference_request", lambda: ReferenceRequest(COMMAND)),
+    ("request", lambda: Request(COMMAND, query=PROPERTY_POWER)),
+    ("request_with_future", create_request_with_future),
+    ("reference_state", create_reference_state),
+    ("state", create_state),
+]
+
+
+def measure_allocations(func, number):
+    """Bytes allocated per instance, for number instances kept alive."""
+    instances = [None] * number
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        for i in range(number):
+            instances[i] = func()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (current - start) / number
+
+
+async def run(args):
+    # Futures need a running loop
+    return {
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "parameters": vars(args),
+        "bytes_per_instance": {
+            name: round(measure_allocations(func, args.number), 1)
+            for name, func in CASES
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=10000, help="Instances")
+    parser.add_argument("--output", help="File to write the JSON report to")
+    args = parser.parse_args()
+    output = args.output
+    del args.output
+
+    report = asyncio.run(run(args))
+    for name, size in report["bytes_per_instance"].items():
+        print(f"{name:<24}{size:>10}")
+    if output:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Reload soak test of a projector against a simulated projector.
+
+Repeats what a config entry reload does to its projector: start it, poll it
+with requests still in flight, and stop it with Projector.async_stop, as
+async_unload_entry does. Checks that no tasks, control sessions or sockets are
+left over after each reload and after the last stop, and exits with status 1
+if any leaked.
+
+Run from the repository root, e.g.:
+
+    python -m scripts.soak_test --reloads 50
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+from custom_components.epson_projector_link.projector import Projector
+from custom_components.epson_projector_link.projector.const import PROPERTY_POWER
+
+from .load_test import POLL_PROPERTIES
+from .load_test import SimulatedProjector
+from .load_test import get_commit
+
+# Let closed sessions and transports finish closing before counting
+SETTLE_TIME = 0.05
+
+
+def count_open_fds():
+    """Open file descriptors of the process, or None without /proc."""
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
+
+
+def count_tasks():
+    return len(asyncio.all_tasks()) - 1
+
+
+async def reload(simulator, in_flight):
+    projector = Projector("127.0.0.1", simulator.port)
+    await projector.async_start()
+    await projector.get_property(PROPERTY_POWER)
+    # Leave polls queued when stopping, like an unload during a poll cycle
+    polls = [
+        asyncio.create_task(projector.get_property(prop, background=True))
+        for prop in POLL_PROPERTIES[:in_flight]
+    ]
+    await asyncio.sleep(0)
+    await projector.async_stop(drain_timeout=0)
+    await asyncio.gather(*polls, return_exceptions=True)
+
+
+async def run(args):
+    simulator = SimulatedProjector(args.latency, 0, args.imevent_interval)
+    await simulator.start()
+    await asyncio.sleep(SETTLE_TIME)
+    tasks_start = count_tasks()
+    fds_start = count_open_fds()
+
+    samples = []
+    for _ in range(args.reloads):
+        await reload(simulator, args.in_flight)
+        await asyncio.sleep(SETTLE_TIME)
+        samples.append(
+            {
+                "tasks": count_tasks() - tasks_start,
+                "sessions": simulator.sessions,
+                "fds": None if fds_start is None else count_open_fds() - fds_start,
+            }
+        )
+    await simulator.stop()
+
+    leaked = {
+        key: max(sample[key] for sample in samples)
+        for key in ("tasks", "sessions", "fds")
+        if samples[0][key] is not None
+    }
+    return {
+        "commit": get_commit(),
+        "parameters": vars(args),
+        "leaked": leaked,
+        "last": samples[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reloads", type=int, default=20)
+    parser.add_argument(
+        "--in-flight", type=int, default=3, help="Polls queued when stopping"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="Simulated response seconds"
+    )
+    parser.add_argument(
+        "--imevent-interval",
+        type=float,
+        default=0.05,
+        help="Seconds between repeated IMEVENT pushes, 0 to disable",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2))
+    if any(report["leaked"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Tests for epson_projector_link."""
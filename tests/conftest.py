@@ -0,0 +1,25 @@
+"""Fixtures for epson_projector_link tests."""
+
+import pytest_asyncio
+from scripts.load_test import SimulatedProjector
+
+from custom_components.epson_projector_link.projector import Projector
+
+# Seconds the simulated projector takes to answer, so requests queue up
+LATENCY = 0.05
+
+
+@pytest_asyncio.fixture
+async def simulator():
+    simulator = SimulatedProjector(LATENCY, 0, 0)
+    await simulator.start()
+    yield simulator
+    await simulator.stop()
+
+
+@pytest_asyncio.fixture
+async def projector(simulator):
+    projector = Projector("127.0.0.1", simulator.port, max_queue_depth=4)
+    await projector.async_start()
+    yield projector
+    await projector.async_stop(drain_timeout=0)
@@ -0,0 +1,84 @@
+"""Tests of the projector request queue against a simulated projector."""
+
+import asyncio
+
+import pytest
+
+from custom_components.epson_projector_link.projector.const import PROPERTY_LAMP_HOURS
+from custom_components.epson_projector_link.projector.const import PROPERTY_POWER
+from custom_components.epson_projector_link.projector.const import PROPERTY_SOURCE
+from custom_components.epson_projector_link.projector.const import PROPERTY_VOLUME
+from custom_components.epson_projector_link.projector.exceptions import (
+    ProjectorInvalidResponse,
+)
+from custom_components.epson_projector_link.projector.exceptions import (
+    ProjectorQueueFull,
+)
+
+
+async def _queue_behind_power(projector, *coros):
+    """Run coros while a power query is in flight, so their requests queue up."""
+    power = asyncio.create_task(projector.get_property(PROPERTY_POWER))
+    await asyncio.sleep(0)
+    return await asyncio.gather(power, *coros, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_duplicate_queries_are_folded(projector, simulator):
+    results = await _queue_behind_power(
+        projector,
+        *(projector.get_property(PROPERTY_VOLUME) for _ in range(3)),
+    )
+
+    assert results[1:] == [10, 10, 10]
+    assert simulator.command_counts[f"{PROPERTY_VOLUME}?"] == 1
+
+
+@pytest.mark.asyncio
+async def test_query_is_folded_into_pending_set(projector, simulator):
+    results = await _queue_behind_power(
+        projector,
+        projector.set_property(PROPERTY_SOURCE, "30"),
+        projector.get_property(PROPERTY_SOURCE),
+    )
+
+    assert not any(isinstance(result, Exception) for result in results)
+    assert simulator.command_counts[f"{PROPERTY_SOURCE} 30"] == 1
+    assert simulator.command_counts[f"{PROPERTY_SOURCE}?"] == 0
+
+
+@pytest.mark.asyncio
+async def test_background_request_is_shed_when_full(projector, simulator):
+    background = projector.get_property(PROPERTY_LAMP_HOURS, background=True)
+    foreground = [
+        projector.send_command(f"KEY {i:02X}", coalesce=False) for i in range(3)
+    ]
+    results = await _queue_behind_power(projector, background, *foreground)
+
+    assert isinstance(results[1], ProjectorQueueFull)
+    assert not any(isinstance(result, Exception) for result in results[2:])
+    assert simulator.command_counts[f"{PROPERTY_LAMP_HOURS}?"] == 0
+
+
+@pytest.mark.asyncio
+async def test_foreground_request_fails_when_full(projector):
+    foreground = [
+        projector.send_command(f"KEY {i:02X}", coalesce=False) for i in range(4)
+    ]
+    results = await _queue_behind_power(projector, *foreground)
+
+    assert not any(isinstance(result, Exception) for result in results[:-1])
+    assert isinstance(results[-1], ProjectorQueueFull)
+
+
+@pytest.mark.asyncio
+async def test_resync_after_invalid_response(projector, simulator):
+    simulator.responses[f"{PROPERTY_LAMP_HOURS}?"] = b"LAMP\x00\xff\r:"
+
+    with pytest.raises(ProjectorInvalidResponse):
+        await projector.get_property(PROPERTY_LAMP_HOURS)
+
+    # The connection is dropped and reopened for the next request
+    assert await projector.get_property(PROPERTY_VOLUME) == 10
+    assert simulator.connection_count == 2
+    assert projector.history.as_dict()["resync_count"] == 1